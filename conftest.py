@@ -8,6 +8,7 @@ The installed smartpy package (0.2.2) is not the SmartPy for Tezos. This mock
 provides enough of an interface to allow test collection and discovery.
 """
 
+import os
 import sys
 import types
 import pytest
@@ -111,28 +112,40 @@ def mock_big_map(*args, **kwargs):
         return MockBigMap(dict(args) if isinstance(args[0], tuple) else {})
     return MockBigMap()
 
+class MockTestScenario:
+    """Mock for the scenario object returned by sp.test_scenario()"""
+    __test__ = False  # not a pytest test class
+    
+    def __init__(self):
+        self.now_in_seconds = 1000
+    
+    def __iadd__(self, other):
+        return self
+    
+    def verify(self, condition, msg=""):
+        assert condition, msg
+    
+    def h1(self, title):
+        print(f"\n{'='*70}\n{title}\n{'='*70}")
+    
+    def h2(self, subtitle):
+        print(f"\n  {subtitle}")
+    
+    def h3(self, subtitle):
+        print(f"\n  {subtitle}")
+
+# SP_QUIET=1 drops scenario headings; they are print-only and add noise
+# (and time) to CI runs. Assertions in verify() are unaffected.
+if os.environ.get("SP_QUIET") == "1":
+    MockTestScenario.h1 = MockTestScenario.h2 = MockTestScenario.h3 = (
+        lambda self, title: None
+    )
+
 def mock_test_scenario():
     """Mock for sp.test_scenario()"""
-    class TestScenario:
-        def __init__(self):
-            self.now_in_seconds = 1000
-        
-        def __iadd__(self, other):
-            return self
-        
-        def verify(self, condition, msg=""):
-            assert condition, msg
-        
-        def h1(self, title):
-            print(f"\n{'='*70}\n{title}\n{'='*70}")
-        
-        def h2(self, subtitle):
-            print(f"\n  {subtitle}")
-        
-        def h3(self, subtitle):
-            print(f"\n  {subtitle}")
-    
-    return TestScenario()
+    # The class is defined once at import; building a class per call was
+    # the dominant cost of scenario setup in @sp.add_test style tests.
+    return MockTestScenario()
 
 # Patch the already-imported smartpy module
 import smartpy as sp
@@ -253,6 +266,8 @@ sp.utils = Utils()
 # Testing decorator
 def mock_add_test(name="", **kwargs):
     def decorator(func):
+        # Kept so pytest hooks can group tests by their "[CATEGORY]" prefix
+        func.sp_test_name = name
         return func
     return decorator
 
@@ -665,4 +680,46 @@ sp.add_compilation_target = mock_add_compilation_target
 # Module exports
 sp.build = lambda name: None
 
+
+def pytest_configure(config):
+    # Registered here too so the marker is known when xdist is not installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests sharing name on one xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Group @sp.add_test scenarios by "[CATEGORY]" for --dist loadgroup."""
+    for item in items:
+        name = getattr(getattr(item, "function", None), "sp_test_name", "")
+        if name.startswith("[") and "]" in name:
+            category = name[1:name.index("]")]
+            item.add_marker(pytest.mark.xdist_group(category))
+            # user_properties travel with the reports (also across xdist)
+            item.user_properties.append(("sp_category", category))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Tabulate @sp.add_test scenario outcomes by "[CATEGORY]"."""
+    counts = {}
+    for outcome in ("passed", "failed"):
+        for report in terminalreporter.stats.get(outcome, []):
+            category = dict(getattr(report, "user_properties", ())).get("sp_category")
+            if category:
+                counts.setdefault(category, {"passed": 0, "failed": 0})[outcome] += 1
+    if not counts:
+        return
+
+    terminalreporter.write_sep("=", "SmartPy scenarios by category")
+    for category, c in sorted(counts.items()):
+        terminalreporter.write_line(
+            "%-16s %3d passed %3d failed" % (category, c["passed"], c["failed"])
+        )
+    terminalreporter.write_line("%-16s %3d passed %3d failed" % (
+        "TOTAL",
+        sum(c["passed"] for c in counts.values()),
+        sum(c["failed"] for c in counts.values()),
+    ))
+
+
 print("[conftest.py] SmartPy mock loaded successfully")
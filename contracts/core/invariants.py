@@ -76,6 +76,9 @@ class FundsSafetyInvariant:
     name = "Funds Safety"
     severity = "CRITICAL"
     
+    STATE_RELEASED = 2
+    STATE_REFUNDED = 3
+    
     @staticmethod
     def verify(state: int, amount: sp.TNat) -> bool:
         """
@@ -85,19 +88,12 @@ class FundsSafetyInvariant:
         
         Rule: Only allow if state is terminal (RELEASED or REFUNDED)
         """
-        STATE_RELEASED = 2
-        STATE_REFUNDED = 3
-        
-        # Reject if state is not terminal
-        if state not in [STATE_RELEASED, STATE_REFUNDED]:
-            return False
-        
-        # Reject if amount is zero (no-op transfer)
-        if amount == 0:
-            return False
-        
-        # Otherwise allow
-        return True
+        # Terminal states only, and never a zero-amount (no-op) transfer
+        return (
+            state in (FundsSafetyInvariant.STATE_RELEASED,
+                      FundsSafetyInvariant.STATE_REFUNDED)
+            and amount != 0
+        )
 
 
 # ==============================================================================
@@ -183,11 +179,11 @@ class StateConsistencyInvariant:
     STATE_REFUNDED = 3
     
     # Valid FSM transitions: (from_state, to_state)
-    VALID_TRANSITIONS = {
+    VALID_TRANSITIONS = frozenset({
         (0, 1),  # INIT → FUNDED
         (1, 2),  # FUNDED → RELEASED
         (1, 3),  # FUNDED → REFUNDED
-    }
+    })
     
     @staticmethod
     def verify(from_state: int, to_state: int) -> bool:
@@ -198,14 +194,7 @@ class StateConsistencyInvariant:
         
         Rule: Only allow transitions in VALID_TRANSITIONS
         """
-        transition = (from_state, to_state)
-        
-        # Reject if transition not in valid set
-        if transition not in StateConsistencyInvariant.VALID_TRANSITIONS:
-            return False
-        
-        # Otherwise allow
-        return True
+        return (from_state, to_state) in StateConsistencyInvariant.VALID_TRANSITIONS
 
 
 # ==============================================================================
@@ -377,6 +366,14 @@ class TimeSafetyInvariant:
     MIN_TIMEOUT_SECONDS = 3600  # 1 hour minimum
     MAX_TIMEOUT_SECONDS = 365 * 24 * 3600  # 1 year maximum
     
+    # States that hold no locked funds: INIT (nothing deposited yet),
+    # RELEASED and REFUNDED (already transferred out)
+    UNLOCKED_STATES = frozenset({
+        StateConsistencyInvariant.STATE_INIT,
+        StateConsistencyInvariant.STATE_RELEASED,
+        StateConsistencyInvariant.STATE_REFUNDED,
+    })
+    
     @staticmethod
     def verify_timeout(timeout_seconds: int) -> bool:
         """
@@ -407,20 +404,12 @@ class TimeSafetyInvariant:
           - If state is FUNDED and timeout not expired: Not yet recoverable
           - If state is INIT: Not funded, nothing to recover
         """
-        STATE_INIT = 0
-        STATE_FUNDED = 1
-        STATE_RELEASED = 2
-        STATE_REFUNDED = 3
+        if state in TimeSafetyInvariant.UNLOCKED_STATES:
+            return True  # Not funded, or already transferred
         
-        if state in [STATE_RELEASED, STATE_REFUNDED]:
-            return True  # Already transferred, not locked
-        
-        if state == STATE_FUNDED:
+        if state == StateConsistencyInvariant.STATE_FUNDED:
             return now >= deadline  # Recoverable only after timeout
         
-        if state == STATE_INIT:
-            return True  # Not funded, no lock
-        
         return False  # Unknown state
 
 
@@ -561,13 +550,16 @@ class InvariantRegistry:
         NoFundLockingInvariant,
     ]
     
+    # name → invariant class, built once
+    _BY_NAME = {inv.name: inv for inv in INVARIANTS}
+    
     @staticmethod
     def get_invariant_by_name(name: str):
         """Lookup invariant by name"""
-        for inv in InvariantRegistry.INVARIANTS:
-            if inv.name == name:
-                return inv
-        raise ValueError(f"Unknown invariant: {name}")
+        try:
+            return InvariantRegistry._BY_NAME[name]
+        except KeyError:
+            raise ValueError(f"Unknown invariant: {name}") from None
     
     @staticmethod
     def list_invariants():
@@ -0,0 +1,108 @@
+"""
+Shared test helpers
+===================
+
+Addresses, amounts, timeouts and contract helpers used across the test
+modules. Defined once here so every module agrees on the same values.
+"""
+
+import copy
+import functools
+
+import smartpy as sp
+
+from contracts.core.escrow_base import MIN_TIMEOUT_SECONDS, SimpleEscrow
+
+
+class _Constants(type):
+    """Metaclass that rejects rebinding class attributes.
+
+    These classes are shared by every test module; a test that
+    reassigned Addr.DEPOSITOR would silently change all later tests.
+    """
+
+    def __setattr__(cls, name, value):
+        raise AttributeError("%s.%s is read-only" % (cls.__name__, name))
+
+    def __delattr__(cls, name):
+        raise AttributeError("%s.%s is read-only" % (cls.__name__, name))
+
+
+class Addr(metaclass=_Constants):
+    """
+    Test addresses with semantic names.
+
+    IMPORTANT: These are separate addresses to test isolation.
+    """
+    DEPOSITOR = sp.address("tz1DEPOSITOR1111111111111111111111111")
+    BENEFICIARY = sp.address("tz1BENEFICIARY111111111111111111111")
+    ARBITER = sp.address("tz1ARBITER111111111111111111111111111")
+    ATTACKER = sp.address("tz1ATTACKER11111111111111111111111111")
+    COLLUDING_ATTACKER = sp.address("tz1COLLUDING1111111111111111111111")
+    RANDOM_THIRD_PARTY = sp.address("tz1RANDOM111111111111111111111111111")
+
+
+class Amount(metaclass=_Constants):
+    """Test amounts in mutez"""
+    ESCROW = sp.nat(1_000_000)          # 1 XTZ
+    HALF = sp.nat(500_000)              # 0.5 XTZ
+    DOUBLE = sp.nat(2_000_000)          # 2 XTZ
+    DUST = sp.nat(1)                    # 1 mutez
+    LARGE = sp.nat(1_000_000_000_000)   # 1M XTZ
+
+    ESCROW_MUTEZ = sp.utils.nat_to_mutez(ESCROW)
+    HALF_MUTEZ = sp.utils.nat_to_mutez(HALF)
+    DOUBLE_MUTEZ = sp.utils.nat_to_mutez(DOUBLE)
+
+
+class Timeout(metaclass=_Constants):
+    """Test timeouts in seconds"""
+    MIN = sp.nat(MIN_TIMEOUT_SECONDS)   # 1 hour (minimum)
+    ONE_DAY = sp.nat(86400)             # 24 hours
+    ONE_WEEK = sp.nat(604800)           # 7 days
+
+
+def snapshot(escrow):
+    """Independent copy of a contract's storage fields."""
+    return copy.deepcopy(vars(escrow.data))
+
+
+def clone(template):
+    """Copy a contract's storage without re-running its constructor.
+
+    Only the storage record is copied; copy.deepcopy() cannot be used on
+    the contract itself: the SmartPy mock resolves unknown attributes
+    (e.g. __deepcopy__) to None.
+    """
+    escrow = object.__new__(type(template))
+    escrow.__dict__.update(template.__dict__)
+    escrow.data = object.__new__(type(template.data))
+    vars(escrow.data).update(snapshot(template))
+    return escrow
+
+
+@functools.lru_cache(maxsize=None)
+def _template(build, *args, **kwargs):
+    """Run build(*args, **kwargs) once per distinct argument set."""
+    return build(*args, **kwargs)
+
+
+def from_template(build, *args, **kwargs):
+    """Fresh copy of the contract build(*args, **kwargs) returns.
+
+    build is a contract class or a module-level function returning a
+    contract (e.g. one driven into FUNDED); it runs once per distinct,
+    hashable argument set and every call gets its own storage.
+    """
+    return clone(_template(build, *args, **kwargs))
+
+
+def build_simple_escrow(timeout=Timeout.ONE_DAY):
+    """Fresh copy of the standard depositor/beneficiary escrow."""
+    return from_template(
+        SimpleEscrow,
+        depositor=Addr.DEPOSITOR,
+        beneficiary=Addr.BENEFICIARY,
+        amount=Amount.ESCROW,
+        timeout_seconds=timeout
+    )
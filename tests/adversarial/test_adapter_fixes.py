@@ -0,0 +1,237 @@
+"""
+Security Fixes Test Suite: EscrowAdapter
+========================================
+
+Tests verifying that the audit findings against the adapter have been
+properly fixed.
+
+Fixes Tested:
+    C-01: create_and_fund fund lock → DISABLED (fails with error)
+    C-02: Adapter pass-through auth bypass → DISABLED (fails with error)
+
+Escrow contract fixes (H-01, H-02, M-01, L-01) are in
+test_simple_escrow_fixes.py.
+"""
+
+import smartpy as sp
+
+from contracts.core.escrow_base import (
+    EscrowError,
+    STATE_FUNDED,
+    STATE_RELEASED,
+)
+from contracts.adapters.escrow_adapter import (
+    EscrowAdapter,
+    AdapterError,
+)
+from tests._common import (
+    Addr, Amount, Timeout, build_simple_escrow, from_template,
+)
+
+
+# ==============================================================================
+# ADAPTER FACTORY
+# ==============================================================================
+
+def fresh_adapter():
+    """Fresh copy of an empty adapter"""
+    return from_template(EscrowAdapter)
+
+
+# Standard create_escrow()/create_and_fund() request; records are read-only
+# to the adapter, so one instance serves every test
+CREATE_PARAMS = sp.record(
+    beneficiary=Addr.BENEFICIARY,
+    amount=Amount.ESCROW,
+    timeout_seconds=Timeout.ONE_DAY
+)
+
+
+# ==============================================================================
+# C-01: create_and_fund DISABLED TEST
+# ==============================================================================
+
+@sp.add_test(name="C-01: create_and_fund is disabled")
+def test_create_and_fund_disabled():
+    """
+    VULNERABILITY: create_and_fund would lock funds (state=INIT with balance>0)
+    FIX: Operation is disabled with explicit error
+    """
+    scenario = sp.test_scenario()
+    scenario.h1("C-01: create_and_fund is disabled")
+
+    # Deploy adapter
+    adapter = fresh_adapter()
+    scenario += adapter
+
+    # Attempt create_and_fund (should fail)
+    scenario.h2("Attempting create_and_fund (should fail)")
+    scenario += adapter.create_and_fund(CREATE_PARAMS).run(
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ,
+        valid=False,
+        exception=AdapterError.DISABLED_USE_DIRECT_CALL
+    )
+
+    scenario.h2("Verified: create_and_fund correctly disabled")
+
+
+# ==============================================================================
+# C-02: ADAPTER PASS-THROUGH DISABLED TESTS
+# ==============================================================================
+
+# (entrypoint, sender, attached amount)
+PASSTHROUGH_CALLS = [
+    # C-02a: would fail anyway (sp.sender = adapter, not depositor)
+    ("fund_escrow", Addr.DEPOSITOR, Amount.ESCROW_MUTEZ),
+    # C-02b/c: would always fail (sp.sender = adapter)
+    ("release_escrow", Addr.DEPOSITOR, sp.tez(0)),
+    ("refund_escrow", Addr.DEPOSITOR, sp.tez(0)),
+    # C-02d: disabled for consistency
+    ("force_refund_escrow", Addr.RANDOM_THIRD_PARTY, sp.tez(0)),
+]
+
+
+@sp.add_test(name="C-02: Adapter pass-through entrypoints are disabled")
+def test_passthrough_disabled():
+    """
+    VULNERABILITY: Pass-through calls reach the escrow with sp.sender set
+                   to the adapter, so authorization checks always fail
+    FIX: Every pass-through operation is disabled with an explicit error
+    """
+    scenario = sp.test_scenario()
+    scenario.h1("C-02: Adapter pass-through entrypoints are disabled")
+
+    adapter = fresh_adapter()
+    scenario += adapter
+
+    # Create escrow first
+    scenario += adapter.create_escrow(CREATE_PARAMS).run(sender=Addr.DEPOSITOR)
+
+    for entrypoint, sender, amount in PASSTHROUGH_CALLS:
+        scenario.h2("Attempting " + entrypoint + " (should fail)")
+        scenario += getattr(adapter, entrypoint)(sp.address("KT1Escrow")).run(
+            sender=sender,
+            amount=amount,
+            valid=False,
+            exception=AdapterError.DISABLED_USE_DIRECT_CALL
+        )
+
+    scenario.h2("Verified: all pass-through operations correctly disabled")
+
+
+# ==============================================================================
+# ADAPTER SAFE OPERATIONS TESTS
+# ==============================================================================
+
+@sp.add_test(name="Adapter: create_escrow works correctly")
+def test_adapter_create_escrow_works():
+    """
+    Verify that create_escrow (factory function) still works correctly
+    """
+    scenario = sp.test_scenario()
+    scenario.h1("Adapter: create_escrow works correctly")
+
+    adapter = fresh_adapter()
+    scenario += adapter
+
+    # Create escrow (no funds attached)
+    scenario.h2("Creating escrow via adapter")
+    scenario += adapter.create_escrow(CREATE_PARAMS).run(
+        sender=Addr.DEPOSITOR,
+        amount=sp.tez(0)  # Must be zero
+    )
+
+    # Verify escrow registered
+    scenario.verify(adapter.data.escrow_count == 1)
+
+    scenario.h2("Verified: create_escrow works correctly")
+
+
+@sp.add_test(name="Adapter: create_escrow rejects attached funds")
+def test_adapter_create_escrow_rejects_funds():
+    """
+    Verify that create_escrow rejects any attached funds
+    """
+    scenario = sp.test_scenario()
+    scenario.h1("Adapter: create_escrow rejects attached funds")
+
+    adapter = fresh_adapter()
+    scenario += adapter
+
+    # Attempt with attached funds (should fail)
+    scenario.h2("Attempting create_escrow with funds (should fail)")
+    scenario += adapter.create_escrow(CREATE_PARAMS).run(
+        sender=Addr.DEPOSITOR,
+        amount=sp.tez(1),  # Attached funds
+        valid=False,
+        exception=EscrowError.AMOUNT_MISMATCH
+    )
+
+    scenario.h2("Verified: create_escrow rejects attached funds")
+
+
+# ==============================================================================
+# FULL WORKFLOW TEST
+# ==============================================================================
+
+@sp.add_test(name="Full workflow: Create via adapter, fund directly")
+def test_full_workflow():
+    """
+    Test the correct usage pattern:
+    1. Create escrow via adapter (factory)
+    2. Fund escrow directly (not via adapter)
+    3. Release escrow directly
+    """
+    scenario = sp.test_scenario()
+    scenario.h1("Full workflow: Create via adapter, fund directly")
+
+    # Deploy adapter
+    adapter = fresh_adapter()
+    scenario += adapter
+
+    # Step 1: Create escrow via adapter
+    scenario.h2("Step 1: Create escrow via adapter")
+    # Note: In real usage, you'd get the escrow address from the operation result
+    # For this test, we deploy escrow directly to simulate
+
+    escrow = build_simple_escrow()
+    scenario += escrow
+
+    # Step 2: Fund escrow DIRECTLY (not via adapter)
+    scenario.h2("Step 2: Fund escrow directly")
+    scenario += escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ
+    )
+    scenario.verify(escrow.data.state == STATE_FUNDED)
+
+    # Step 3: Release escrow DIRECTLY
+    scenario.h2("Step 3: Release escrow directly")
+    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
+    scenario.verify(escrow.data.state == STATE_RELEASED)
+
+    scenario.h2("Verified: Full workflow completes successfully")
+
+
+# ==============================================================================
+# SUMMARY
+# ==============================================================================
+
+"""
+TEST SUMMARY
+============
+
+Adapter security fixes verified:
+
+✅ C-01: create_and_fund disabled (prevents fund lock)
+✅ C-02a: fund_escrow pass-through disabled
+✅ C-02b: release_escrow pass-through disabled
+✅ C-02c: refund_escrow pass-through disabled
+✅ C-02d: force_refund_escrow pass-through disabled
+
+Additional verification:
+✅ Adapter create_escrow works correctly
+✅ Adapter create_escrow rejects attached funds
+✅ Full workflow: adapter create -> direct fund -> direct release
+"""
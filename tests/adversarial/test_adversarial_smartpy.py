@@ -18,6 +18,20 @@ Test Categories:
     4. INVALID_STATE - Forbidden state transitions
     5. DOUBLE_SPEND - Multiple withdrawal attempts
     6. FUND_LOCK - Permanent locking attack attempts
+    7. AMOUNT - Exact funding amount enforcement
+    8. INIT - Constructor validation
+
+Security Invariants Tested:
+    1. Fund Transfer Isolation
+    2. State Monotonicity
+    3. Party Immutability
+    4. FSM-First Design
+    5. Balance Consistency
+    6. No Unauthorized Transitions
+    7. Timeout Liveness
+
+Per-category pass counts are printed at the end of a pytest run
+(see pytest_terminal_summary in conftest.py).
 
 Each test documents:
     - THREAT: What attack is being attempted
@@ -27,9 +41,11 @@ Each test documents:
 
 Reference: security/invariants/invariants_enforcement.md
 
-Run: python -m smartpy test tests/test_fortiescrow.py
+Run: python -m pytest tests/adversarial/test_adversarial_smartpy.py
+(SmartPy mock from conftest.py only; see tests/README.md)
 """
 
+import pytest
 import smartpy as sp
 
 from contracts.core.escrow_base import (
@@ -41,44 +57,24 @@ from contracts.core.escrow_base import (
     STATE_REFUNDED,
     MIN_TIMEOUT_SECONDS,
 )
+from tests._common import Addr, Amount, Timeout, from_template
 
 
 # ==============================================================================
 # TEST CONFIGURATION
 # ==============================================================================
 
-class Addr:
-    """
-    Test addresses with semantic names.
-
-    IMPORTANT: These are separate addresses to test isolation.
-    """
-    DEPOSITOR = sp.address("tz1DEPOSITOR1111111111111111111111111")
-    BENEFICIARY = sp.address("tz1BENEFICIARY111111111111111111111")
-    ATTACKER = sp.address("tz1ATTACKER11111111111111111111111111")
-    COLLUDING_ATTACKER = sp.address("tz1COLLUDING1111111111111111111111")
-    RANDOM_THIRD_PARTY = sp.address("tz1RANDOM111111111111111111111111111")
-
-
-class Amount:
-    """Test amounts in mutez"""
-    ESCROW = sp.nat(1_000_000)          # 1 XTZ
-    HALF = sp.nat(500_000)              # 0.5 XTZ
-    DOUBLE = sp.nat(2_000_000)          # 2 XTZ
-    DUST = sp.nat(1)                    # 1 mutez
-    LARGE = sp.nat(1_000_000_000_000)   # 1M XTZ
+# Funding time used by the timeout tests; also the unset funded_at/deadline
+T0 = sp.timestamp(0)
 
-
-class Timeout:
-    """Test timeouts in seconds"""
-    MIN = sp.nat(MIN_TIMEOUT_SECONDS)   # 1 hour (minimum)
-    ONE_DAY = sp.nat(86400)             # 24 hours
-    ONE_WEEK = sp.nat(604800)           # 7 days
+# Just past the deadline of a Timeout.MIN escrow funded at time 0
+AFTER_MIN_TIMEOUT = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
 
 
 def create_escrow(amount=None, timeout=None, depositor=None, beneficiary=None):
-    """Factory for test escrow instances"""
-    return SimpleEscrow(
+    """Factory for test escrow instances (copies of a cached template)"""
+    return from_template(
+        SimpleEscrow,
         depositor=depositor or Addr.DEPOSITOR,
         beneficiary=beneficiary or Addr.BENEFICIARY,
         amount=amount or Amount.ESCROW,
@@ -86,6 +82,37 @@ def create_escrow(amount=None, timeout=None, depositor=None, beneficiary=None):
     )
 
 
+def funded_escrow(scenario, timeout=None, now=None):
+    """Add a fresh escrow to scenario and fund it as the depositor"""
+    escrow = create_escrow(timeout=timeout)
+    scenario += escrow
+    scenario += escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ,
+        now=now
+    )
+    return escrow
+
+
+def _closed(close):
+    """Default escrow driven through fund() and close() ("release" or
+    "refund"); terminal-state tests start from copies of it."""
+    escrow = create_escrow()
+    escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ
+    )
+    getattr(escrow, close)().run(sender=Addr.DEPOSITOR)
+    return escrow
+
+
+def closed_escrow(scenario, close):
+    """Add a copy of the escrow already closed by close() to scenario"""
+    escrow = from_template(_closed, close)
+    scenario += escrow
+    return escrow
+
+
 # ==============================================================================
 # CATEGORY 1: HAPPY PATH TESTS
 # ==============================================================================
@@ -122,10 +149,12 @@ def test_happy_path_fund_release():
     scenario.h2("Step 1: Depositor funds escrow")
     scenario += escrow.fund().run(
         sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
+        amount=Amount.ESCROW_MUTEZ
+    )
+    scenario.verify(
+        (escrow.data.state == STATE_FUNDED)
+        & (escrow.data.funded_at != T0)
     )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.verify(escrow.data.funded_at != sp.timestamp(0))
 
     # Step 2: Release
     scenario.h2("Step 2: Depositor releases to beneficiary")
@@ -155,14 +184,7 @@ def test_happy_path_fund_refund():
     scenario = sp.test_scenario()
     scenario.h1("Happy Path: Fund → Refund")
 
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
+    escrow = funded_escrow(scenario)
 
     # Refund
     scenario += escrow.refund().run(
@@ -177,34 +199,31 @@ def test_happy_path_fund_refund():
 # CATEGORY 2: TIMEOUT TESTS
 # ==============================================================================
 
-@sp.add_test(name="[TIMEOUT] Force refund becomes available after deadline")
-def test_timeout_force_refund_after_deadline():
+@sp.add_test(name="[TIMEOUT] Deadline switches release off and force refund on")
+def test_timeout_deadline_transition():
     """
-    THREAT: Depositor abandons escrow, funds stuck forever
+    THREAT: Depositor abandons escrow, funds stuck forever; or
+            depositor tries to release after deadline (stale escrow)
 
     SETUP:
         - Funded escrow with 1-hour timeout
         - Time advances past deadline
 
     ACTION:
-        - Third party triggers force_refund()
+        1. Third party triggers force_refund() just before deadline
+        2. Depositor attempts release() after deadline
+        3. Third party triggers force_refund() after deadline
 
     EXPECTED:
-        - SUCCESS: Funds returned to depositor (not caller)
-        - Anti-fund-locking guarantee fulfilled
+        - Step 1: REJECTED: TIMEOUT_NOT_EXPIRED error
+        - Step 2: REJECTED: DEADLINE_PASSED error (stale release)
+        - Step 3: SUCCESS: Funds returned to depositor (not caller)
     """
     scenario = sp.test_scenario()
-    scenario.h1("Timeout: Force Refund After Deadline")
-
-    escrow = create_escrow(timeout=Timeout.MIN)
-    scenario += escrow
+    scenario.h1("Timeout: Deadline Transition")
 
     # Fund at time 0
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN, now=T0)
 
     scenario.h2("Before deadline: force_refund blocked")
     scenario += escrow.force_refund().run(
@@ -214,54 +233,23 @@ def test_timeout_force_refund_after_deadline():
         exception=EscrowError.TIMEOUT_NOT_EXPIRED
     )
 
-    scenario.h2("At deadline: force_refund available")
-    scenario += escrow.force_refund().run(
-        sender=Addr.RANDOM_THIRD_PARTY,
-        now=sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
-    )
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-    scenario.h2("✓ SUCCESS: Anti-fund-locking guarantee fulfilled")
-
-
-@sp.add_test(name="[TIMEOUT] Release blocked after deadline")
-def test_timeout_release_blocked_after_deadline():
-    """
-    THREAT: Depositor tries to release after deadline (stale escrow)
-
-    SETUP:
-        - Funded escrow
-        - Time advances past deadline
-
-    ACTION:
-        - Depositor attempts release()
-
-    EXPECTED:
-        - REJECTED: DEADLINE_PASSED error
-        - Stale releases prevented
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Timeout: Release Blocked After Deadline")
-
-    escrow = create_escrow(timeout=Timeout.MIN)
-    scenario += escrow
-
-    # Fund at time 0
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
-
     scenario.h2("After deadline: release blocked")
     scenario += escrow.release().run(
         sender=Addr.DEPOSITOR,
-        now=sp.timestamp(MIN_TIMEOUT_SECONDS + 1),
+        now=AFTER_MIN_TIMEOUT,
         valid=False,
         exception=EscrowError.DEADLINE_PASSED
     )
+    scenario.verify(escrow.data.state == STATE_FUNDED)
 
-    scenario.h2("✓ REJECTED: Stale release prevented")
+    scenario.h2("After deadline: force_refund available")
+    scenario += escrow.force_refund().run(
+        sender=Addr.RANDOM_THIRD_PARTY,
+        now=AFTER_MIN_TIMEOUT
+    )
+    scenario.verify(escrow.data.state == STATE_REFUNDED)
+
+    scenario.h2("✓ SUCCESS: Stale release prevented, funds recovered")
 
 
 @sp.add_test(name="[TIMEOUT] Force refund blocked before deadline")
@@ -283,15 +271,7 @@ def test_timeout_force_refund_blocked_before_deadline():
     scenario = sp.test_scenario()
     scenario.h1("Timeout: Force Refund Blocked Before Deadline")
 
-    escrow = create_escrow(timeout=Timeout.ONE_WEEK)
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.ONE_WEEK, now=T0)
 
     # Immediately try force refund
     scenario += escrow.force_refund().run(
@@ -317,269 +297,106 @@ def test_timeout_force_refund_blocked_before_deadline():
 # CATEGORY 3: UNAUTHORIZED ACCESS TESTS
 # ==============================================================================
 
-@sp.add_test(name="[UNAUTHORIZED] Attacker cannot release funds")
-def test_unauthorized_attacker_cannot_release():
-    """
-    THREAT: External attacker steals funds via release()
-
-    SETUP:
-        - Funded escrow
-        - Attacker knows contract address
-
-    ACTION:
-        - Attacker calls release()
-
-    EXPECTED:
-        - REJECTED: NOT_DEPOSITOR error
-        - Funds remain in contract
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Unauthorized: Attacker Cannot Release")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Attacker tries to release
-    scenario.h2("Attack: External attacker calls release()")
-    scenario += escrow.release().run(
-        sender=Addr.ATTACKER,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.h2("✓ REJECTED: Unauthorized release blocked")
+# (attack description, sender, entrypoint, expected error) on a FUNDED escrow
+UNAUTHORIZED_CALLS = [
+    ("External attacker calls release()",
+     Addr.ATTACKER, "release", EscrowError.NOT_DEPOSITOR),
+    ("Beneficiary tries to self-pay",
+     Addr.BENEFICIARY, "release", EscrowError.NOT_DEPOSITOR),
+    ("Attacker tries to disrupt escrow",
+     Addr.ATTACKER, "refund", EscrowError.NOT_DEPOSITOR),
+    ("Beneficiary tries to trigger refund",
+     Addr.BENEFICIARY, "refund", EscrowError.NOT_DEPOSITOR),
+]
 
 
-@sp.add_test(name="[UNAUTHORIZED] Beneficiary cannot release (self-pay attack)")
-def test_unauthorized_beneficiary_cannot_release():
+@sp.add_test(name="[UNAUTHORIZED] Full matrix")
+def test_unauthorized_matrix():
     """
-    THREAT: Beneficiary self-releases without depositor consent
+    THREAT: Attacker front-runs funding, steals or disrupts funds;
+            beneficiary self-releases or cancels the escrow (possible
+            collusion with depositor)
 
     SETUP:
-        - Funded escrow
-        - Beneficiary wants to skip depositor approval
+        - One escrow, attacked first in INIT and then once funded
+        - Callers know the contract address and watch the mempool
 
     ACTION:
-        - Beneficiary calls release()
+        - ATTACKER sends fund() with the escrow amount
+        - ATTACKER and BENEFICIARY each call release() and refund()
 
     EXPECTED:
-        - REJECTED: NOT_DEPOSITOR error
-        - Consent requirement enforced
+        - REJECTED: NOT_DEPOSITOR error in every case
+        - Depositor's role protected; funds remain in contract
     """
     scenario = sp.test_scenario()
-    scenario.h1("Unauthorized: Beneficiary Cannot Self-Release")
+    scenario.h1("Unauthorized: Full Matrix")
 
     escrow = create_escrow()
     scenario += escrow
 
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Beneficiary tries to release
-    scenario.h2("Attack: Beneficiary tries to self-pay")
-    scenario += escrow.release().run(
-        sender=Addr.BENEFICIARY,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.h2("✓ REJECTED: Beneficiary cannot self-release")
-
-
-@sp.add_test(name="[UNAUTHORIZED] Attacker cannot refund")
-def test_unauthorized_attacker_cannot_refund():
-    """
-    THREAT: Attacker disrupts escrow by triggering early refund
-
-    SETUP:
-        - Funded escrow (not timed out)
-        - Attacker wants to cancel legitimate escrow
-
-    ACTION:
-        - Attacker calls refund()
-
-    EXPECTED:
-        - REJECTED: NOT_DEPOSITOR error
-        - Escrow integrity preserved
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Unauthorized: Attacker Cannot Refund")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
+    scenario.h2("Attack: Attacker front-runs funding")
     scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Attacker tries to refund
-    scenario.h2("Attack: Attacker tries to disrupt escrow")
-    scenario += escrow.refund().run(
         sender=Addr.ATTACKER,
+        amount=Amount.ESCROW_MUTEZ,
         valid=False,
         exception=EscrowError.NOT_DEPOSITOR
     )
+    scenario.verify(escrow.data.state == STATE_INIT)
 
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.h2("✓ REJECTED: Unauthorized refund blocked")
-
-
-@sp.add_test(name="[UNAUTHORIZED] Beneficiary cannot refund (theft attempt)")
-def test_unauthorized_beneficiary_cannot_refund():
-    """
-    THREAT: Beneficiary tries to redirect funds to depositor (collusion)
-
-    SETUP:
-        - Funded escrow
-        - Beneficiary wants to cancel (possible collusion with depositor)
-
-    ACTION:
-        - Beneficiary calls refund()
-
-    EXPECTED:
-        - REJECTED: NOT_DEPOSITOR error
-        - Only depositor controls their funds
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Unauthorized: Beneficiary Cannot Refund")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
+    # Fund once; every rejected call below leaves the state untouched
     scenario += escrow.fund().run(
         sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
+        amount=Amount.ESCROW_MUTEZ
     )
 
-    # Beneficiary tries to refund
-    scenario.h2("Attack: Beneficiary tries to trigger refund")
-    scenario += escrow.refund().run(
-        sender=Addr.BENEFICIARY,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
+    for attack, sender, entrypoint, error in UNAUTHORIZED_CALLS:
+        scenario.h2("Attack: " + attack)
+        scenario += getattr(escrow, entrypoint)().run(
+            sender=sender,
+            valid=False,
+            exception=error
+        )
+        scenario.verify(escrow.data.state == STATE_FUNDED)
 
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.h2("✓ REJECTED: Beneficiary cannot trigger refund")
-
-
-@sp.add_test(name="[UNAUTHORIZED] Non-depositor cannot fund (front-running)")
-def test_unauthorized_non_depositor_cannot_fund():
-    """
-    THREAT: Attacker front-runs depositor's fund transaction
-
-    SETUP:
-        - Fresh escrow
-        - Attacker monitors mempool, sees depositor's tx
-
-    ACTION:
-        - Attacker sends fund() with same amount
-
-    EXPECTED:
-        - REJECTED: NOT_DEPOSITOR error
-        - Depositor's designated role protected
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Unauthorized: Non-Depositor Cannot Fund")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Attacker tries to fund
-    scenario.h2("Attack: Attacker front-runs funding")
-    scenario += escrow.fund().run(
-        sender=Addr.ATTACKER,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Non-depositor cannot fund")
+    scenario.h2("✓ REJECTED: All unauthorized calls blocked")
 
 
 # ==============================================================================
 # CATEGORY 4: INVALID STATE TRANSITION TESTS
 # ==============================================================================
 
-@sp.add_test(name="[INVALID_STATE] Cannot release from INIT state")
-def test_invalid_state_release_from_init():
-    """
-    THREAT: Release called before funding (empty contract)
-
-    SETUP:
-        - Contract just deployed, not funded
-
-    ACTION:
-        - Depositor calls release()
-
-    EXPECTED:
-        - REJECTED: NOT_FUNDED error
-        - FSM enforced: INIT cannot → RELEASED
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Invalid State: Release From INIT")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Try to release without funding
-    scenario.h2("Attack: Release from empty contract")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Cannot release unfunded contract")
-
-
-@sp.add_test(name="[INVALID_STATE] Cannot refund from INIT state")
-def test_invalid_state_refund_from_init():
+@sp.add_test(name="[INVALID_STATE] Cannot release or refund from INIT state")
+def test_invalid_state_from_init():
     """
-    THREAT: Refund called before funding
+    THREAT: Release or refund called before funding (empty contract)
 
     SETUP:
         - Contract just deployed, not funded
 
     ACTION:
-        - Depositor calls refund()
+        - Depositor calls release(), then refund()
 
     EXPECTED:
-        - REJECTED: NOT_FUNDED error
-        - Nothing to refund
+        - REJECTED: NOT_FUNDED error for both
+        - FSM enforced: INIT cannot → RELEASED / REFUNDED
     """
     scenario = sp.test_scenario()
-    scenario.h1("Invalid State: Refund From INIT")
+    scenario.h1("Invalid State: Release/Refund From INIT")
 
     escrow = create_escrow()
     scenario += escrow
 
-    # Try to refund without funding
-    scenario.h2("Attack: Refund from empty contract")
-    scenario += escrow.refund().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
+    for entrypoint in ("release", "refund"):
+        scenario.h2("Attack: %s from empty contract" % entrypoint)
+        scenario += getattr(escrow, entrypoint)().run(
+            sender=Addr.DEPOSITOR,
+            valid=False,
+            exception=EscrowError.NOT_FUNDED
+        )
+        scenario.verify(escrow.data.state == STATE_INIT)
 
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Cannot refund unfunded contract")
+    scenario.h2("✓ REJECTED: Cannot release or refund unfunded contract")
 
 
 @sp.add_test(name="[INVALID_STATE] Cannot fund twice (double-fund attack)")
@@ -600,20 +417,14 @@ def test_invalid_state_double_fund():
     scenario = sp.test_scenario()
     scenario.h1("Invalid State: Double Fund Attack")
 
-    escrow = create_escrow()
-    scenario += escrow
-
     # First fund - succeeds
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
+    escrow = funded_escrow(scenario)
 
     # Second fund - fails
     scenario.h2("Attack: Attempt to fund again")
     scenario += escrow.fund().run(
         sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
+        amount=Amount.ESCROW_MUTEZ,
         valid=False,
         exception=EscrowError.ALREADY_FUNDED
     )
@@ -621,210 +432,90 @@ def test_invalid_state_double_fund():
     scenario.h2("✓ REJECTED: Double funding blocked")
 
 
-@sp.add_test(name="[INVALID_STATE] Cannot release from RELEASED (terminal)")
-def test_invalid_state_release_from_released():
-    """
-    THREAT: Multiple release calls to drain funds
-
-    SETUP:
-        - Already released escrow
-
-    ACTION:
-        - Depositor calls release() again
-
-    EXPECTED:
-        - REJECTED: NOT_FUNDED error
-        - Terminal state is permanent
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Invalid State: Release From RELEASED")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Complete happy path
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
+# (entrypoint that closes the escrow, terminal state, entrypoint retried)
+TERMINAL_STATE_CALLS = [
+    ("release", STATE_RELEASED, "release"),
+    ("release", STATE_RELEASED, "refund"),
+    ("refund", STATE_REFUNDED, "release"),
+    ("refund", STATE_REFUNDED, "refund"),
+]
 
-    # Try to release again
-    scenario.h2("Attack: Double release attempt")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
 
-    scenario.h2("✓ REJECTED: Terminal state enforced")
-
-
-@sp.add_test(name="[INVALID_STATE] Cannot refund from RELEASED (terminal)")
-def test_invalid_state_refund_from_released():
+@sp.add_test(name="[INVALID_STATE] No release/refund from RELEASED or REFUNDED")
+def test_invalid_state_from_terminal():
     """
-    THREAT: Refund after release (contract should be empty)
+    THREAT: Repeated or crossed release/refund calls to drain funds
+            or recover a closed escrow
 
     SETUP:
-        - Already released escrow
+        - Escrow already released or refunded by the depositor
 
     ACTION:
-        - Depositor calls refund()
+        - Depositor calls release() and refund() from each terminal state
 
     EXPECTED:
-        - REJECTED: NOT_FUNDED error
-        - Cannot get funds back after release
+        - REJECTED: NOT_FUNDED error in every case
+        - Terminal states are permanent
     """
     scenario = sp.test_scenario()
-    scenario.h1("Invalid State: Refund From RELEASED")
+    scenario.h1("Invalid State: Release/Refund From Terminal States")
 
-    escrow = create_escrow()
-    scenario += escrow
+    for close, terminal_state, entrypoint in TERMINAL_STATE_CALLS:
+        escrow = closed_escrow(scenario, close)
+        scenario.verify(escrow.data.state == terminal_state)
 
-    # Complete release flow
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
+        scenario.h2("Attack: %s after %s" % (entrypoint, close))
+        scenario += getattr(escrow, entrypoint)().run(
+            sender=Addr.DEPOSITOR,
+            valid=False,
+            exception=EscrowError.NOT_FUNDED
+        )
+        scenario.verify(escrow.data.state == terminal_state)
 
-    # Try to refund after release
-    scenario.h2("Attack: Refund after release")
-    scenario += escrow.refund().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    scenario.h2("✓ REJECTED: Cannot refund after release")
-
-
-@sp.add_test(name="[INVALID_STATE] Cannot release from REFUNDED (terminal)")
-def test_invalid_state_release_from_refunded():
-    """
-    THREAT: Release after refund (impossible state recovery)
-
-    SETUP:
-        - Already refunded escrow
-
-    ACTION:
-        - Depositor calls release()
-
-    EXPECTED:
-        - REJECTED: NOT_FUNDED error
-        - Terminal state blocks all operations
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Invalid State: Release From REFUNDED")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Complete refund flow
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario += escrow.refund().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-    # Try to release after refund
-    scenario.h2("Attack: Release after refund")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    scenario.h2("✓ REJECTED: Terminal state is permanent")
+    scenario.h2("✓ REJECTED: Terminal states enforced")
 
 
 # ==============================================================================
 # CATEGORY 5: DOUBLE-SPEND TESTS
 # ==============================================================================
 
-@sp.add_test(name="[DOUBLE_SPEND] Cannot release then refund")
-def test_double_spend_release_then_refund():
-    """
-    THREAT: Double-spend via release + refund sequence
-
-    SETUP:
-        - Funded escrow
+# (first fund movement, second attempt, expected error)
+DOUBLE_SPEND_CALLS = [
+    ("release", "refund", EscrowError.NOT_FUNDED),
+    ("refund", "release", EscrowError.NOT_FUNDED),
+]
 
-    ACTION:
-        1. Depositor releases (funds → beneficiary)
-        2. Depositor tries to refund (funds → depositor)
 
-    EXPECTED:
-        - Step 1: SUCCESS
-        - Step 2: REJECTED (already terminal)
-        - Only one fund movement allowed
+@sp.add_test(name="[DOUBLE_SPEND] Cannot release then refund, or refund then release")
+def test_double_spend_release_refund():
     """
-    scenario = sp.test_scenario()
-    scenario.h1("Double Spend: Release Then Refund")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Release
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-
-    # Try to also refund (double-spend attempt)
-    scenario.h2("Attack: Attempt refund after release")
-    scenario += escrow.refund().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    scenario.h2("✓ REJECTED: Double-spend prevented")
-
-
-@sp.add_test(name="[DOUBLE_SPEND] Cannot refund then release")
-def test_double_spend_refund_then_release():
-    """
-    THREAT: Double-spend via refund + release sequence
+    THREAT: Double-spend via release + refund (or refund + release)
 
     SETUP:
         - Funded escrow
 
     ACTION:
-        1. Depositor refunds (funds → depositor)
-        2. Depositor tries to release (funds → beneficiary)
+        1. Depositor releases (funds → beneficiary) or refunds
+           (funds → depositor)
+        2. Depositor tries the other operation
 
     EXPECTED:
         - Step 1: SUCCESS
         - Step 2: REJECTED (already terminal)
+        - Only one fund movement allowed
     """
     scenario = sp.test_scenario()
-    scenario.h1("Double Spend: Refund Then Release")
+    scenario.h1("Double Spend: Release/Refund Sequences")
 
-    escrow = create_escrow()
-    scenario += escrow
+    for first, second, error in DOUBLE_SPEND_CALLS:
+        escrow = closed_escrow(scenario, first)
 
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Refund
-    scenario += escrow.refund().run(sender=Addr.DEPOSITOR)
-
-    # Try to also release (double-spend attempt)
-    scenario.h2("Attack: Attempt release after refund")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
+        scenario.h2("Attack: Attempt %s after %s" % (second, first))
+        scenario += getattr(escrow, second)().run(
+            sender=Addr.DEPOSITOR,
+            valid=False,
+            exception=error
+        )
 
     scenario.h2("✓ REJECTED: Double-spend prevented")
 
@@ -848,28 +539,20 @@ def test_double_spend_force_refund_twice():
     scenario = sp.test_scenario()
     scenario.h1("Double Spend: Force Refund Twice")
 
-    escrow = create_escrow(timeout=Timeout.MIN)
-    scenario += escrow
-
     # Fund at time 0
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN, now=T0)
 
     # First force refund - succeeds
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.force_refund().run(
         sender=Addr.RANDOM_THIRD_PARTY,
-        now=after_timeout
+        now=AFTER_MIN_TIMEOUT
     )
 
     # Second force refund - fails
     scenario.h2("Attack: Second force refund attempt")
     scenario += escrow.force_refund().run(
         sender=Addr.ATTACKER,
-        now=after_timeout,
+        now=AFTER_MIN_TIMEOUT,
         valid=False,
         exception=EscrowError.NOT_FUNDED
     )
@@ -903,15 +586,7 @@ def test_fund_lock_timeout_recovery():
     scenario = sp.test_scenario()
     scenario.h1("Fund Lock: Timeout Recovery Guarantee")
 
-    escrow = create_escrow(timeout=Timeout.MIN)
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN, now=T0)
 
     # Simulate: depositor disappears, beneficiary cannot release
     scenario.h2("Scenario: Depositor unavailable, beneficiary cannot release")
@@ -923,10 +598,9 @@ def test_fund_lock_timeout_recovery():
 
     # Wait for timeout
     scenario.h2("After timeout: anyone can recover")
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.force_refund().run(
         sender=Addr.RANDOM_THIRD_PARTY,
-        now=after_timeout
+        now=AFTER_MIN_TIMEOUT
     )
 
     scenario.verify(escrow.data.state == STATE_REFUNDED)
@@ -956,12 +630,12 @@ def test_fund_lock_deadline_immutable():
     scenario += escrow
 
     # Record initial deadline (should be 0 before funding)
-    scenario.verify(escrow.data.deadline == sp.timestamp(0))
+    scenario.verify(escrow.data.deadline == T0)
 
     # Fund - deadline gets set
     scenario += escrow.fund().run(
         sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
+        amount=Amount.ESCROW_MUTEZ,
         now=sp.timestamp(1000)
     )
 
@@ -994,22 +668,13 @@ def test_fund_lock_force_refund_destination():
     scenario = sp.test_scenario()
     scenario.h1("Fund Lock: Force Refund Goes To Depositor")
 
-    escrow = create_escrow(timeout=Timeout.MIN)
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN, now=T0)
 
     # Attacker triggers force refund
     scenario.h2("Attacker triggers force_refund after timeout")
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.force_refund().run(
         sender=Addr.ATTACKER,
-        now=after_timeout
+        now=AFTER_MIN_TIMEOUT
     )
 
     # Funds went to depositor, not attacker
@@ -1023,106 +688,48 @@ def test_fund_lock_force_refund_destination():
 # CATEGORY 7: AMOUNT VALIDATION TESTS
 # ==============================================================================
 
-@sp.add_test(name="[AMOUNT] Under-funding rejected")
-def test_amount_underfunding_rejected():
-    """
-    THREAT: Depositor underfunds to manipulate contract state
-
-    SETUP:
-        - Escrow expects 1 XTZ
-
-    ACTION:
-        - Depositor sends 0.5 XTZ
-
-    EXPECTED:
-        - REJECTED: AMOUNT_MISMATCH error
-        - Exact amount required
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Amount: Under-Funding Rejected")
-
-    escrow = create_escrow(amount=Amount.ESCROW)
-    scenario += escrow
-
-    # Try to underfund
-    scenario.h2("Attack: Send half the required amount")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.HALF),
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
-
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Under-funding blocked")
+# (attack description, amount sent) - all rejected with AMOUNT_MISMATCH
+WRONG_FUNDING_AMOUNTS = [
+    ("Send half the required amount", Amount.HALF_MUTEZ),
+    ("Send double the required amount", Amount.DOUBLE_MUTEZ),
+    ("Fund with zero amount", sp.mutez(0)),
+]
 
 
-@sp.add_test(name="[AMOUNT] Over-funding rejected")
-def test_amount_overfunding_rejected():
+@sp.add_test(name="[AMOUNT] Only the exact amount is accepted")
+def test_amount_wrong_funding_rejected():
     """
-    THREAT: Depositor overfunds expecting extra to be refundable
+    THREAT: Depositor under-funds to manipulate contract state,
+            over-funds expecting the excess to be refundable, or
+            creates a "funded" escrow with zero balance
 
     SETUP:
         - Escrow expects 1 XTZ
 
     ACTION:
-        - Depositor sends 2 XTZ
+        - Depositor sends 0.5 XTZ, 2 XTZ and 0 tez
 
     EXPECTED:
-        - REJECTED: AMOUNT_MISMATCH error
-        - No excess funds trapped in contract
+        - REJECTED: AMOUNT_MISMATCH error in every case
+        - Exact amount required; no excess funds trapped in contract
     """
     scenario = sp.test_scenario()
-    scenario.h1("Amount: Over-Funding Rejected")
+    scenario.h1("Amount: Wrong Funding Amounts Rejected")
 
     escrow = create_escrow(amount=Amount.ESCROW)
     scenario += escrow
 
-    # Try to overfund
-    scenario.h2("Attack: Send double the required amount")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.DOUBLE),
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
-
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Over-funding blocked")
+    for attack, amount in WRONG_FUNDING_AMOUNTS:
+        scenario.h2("Attack: " + attack)
+        scenario += escrow.fund().run(
+            sender=Addr.DEPOSITOR,
+            amount=amount,
+            valid=False,
+            exception=EscrowError.AMOUNT_MISMATCH
+        )
+        scenario.verify(escrow.data.state == STATE_INIT)
 
-
-@sp.add_test(name="[AMOUNT] Zero funding rejected")
-def test_amount_zero_funding_rejected():
-    """
-    THREAT: Create "funded" escrow with zero balance
-
-    SETUP:
-        - Normal escrow
-
-    ACTION:
-        - Depositor sends 0 tez
-
-    EXPECTED:
-        - REJECTED: AMOUNT_MISMATCH error
-        - Cannot create unfunded "funded" state
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Amount: Zero Funding Rejected")
-
-    escrow = create_escrow(amount=Amount.ESCROW)
-    scenario += escrow
-
-    # Try to fund with zero
-    scenario.h2("Attack: Fund with zero amount")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.mutez(0),
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
-
-    scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.h2("✓ REJECTED: Zero funding blocked")
+    scenario.h2("✓ REJECTED: Under-, over- and zero funding blocked")
 
 
 # ==============================================================================
@@ -1144,57 +751,11 @@ def test_init_same_party_rejected():
         - REJECTED: SAME_PARTY error
         - Self-escrow prevented
     """
-    scenario = sp.test_scenario()
-    scenario.h1("Init: Self-Escrow Prevented")
-
-    # Verify constraint exists in contract
-    # (Contract constructor will fail if depositor == beneficiary)
-    scenario.verify(Addr.DEPOSITOR != Addr.BENEFICIARY)
-
-    scenario.h2("✓ VERIFIED: Self-escrow blocked by constructor validation")
-
-
-# ==============================================================================
-# TEST SUMMARY
-# ==============================================================================
-
-@sp.add_test(name="[SUMMARY] All adversarial tests complete")
-def test_summary():
-    """
-    Test Coverage Summary
-    =====================
-
-    Category                  Tests  Status
-    ─────────────────────────────────────────
-    HAPPY_PATH                   2   ✓
-    TIMEOUT                      3   ✓
-    UNAUTHORIZED                 5   ✓
-    INVALID_STATE                6   ✓
-    DOUBLE_SPEND                 3   ✓
-    FUND_LOCK                    3   ✓
-    AMOUNT                       3   ✓
-    INIT                         1   ✓
-    ─────────────────────────────────────────
-    TOTAL                       26   ✓
-
-    Security Invariants Tested:
-    ─────────────────────────────────────────
-    1. Fund Transfer Isolation      ✓
-    2. State Monotonicity           ✓
-    3. Party Immutability           ✓
-    4. FSM-First Design             ✓
-    5. Balance Consistency          ✓
-    6. No Unauthorized Transitions  ✓
-    7. Timeout Liveness            ✓
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Adversarial Test Suite Complete")
-    scenario.h2("All 26 security tests passing")
-
-
-# ==============================================================================
-# RUN TESTS
-# ==============================================================================
-
-if __name__ == "__main__":
-    pass
+    # The constructor itself rejects the parties, so no scenario is needed
+    with pytest.raises(Exception, match=EscrowError.SAME_PARTY):
+        SimpleEscrow(
+            depositor=Addr.DEPOSITOR,
+            beneficiary=Addr.DEPOSITOR,
+            amount=Amount.ESCROW,
+            timeout_seconds=Timeout.ONE_WEEK
+        )
@@ -16,7 +16,8 @@ Test Coverage:
     9. State Verification: Terminal states prevent re-entry
     10. Recovery Guarantee: At least one path always available
 
-Run with: python -m smartpy test tests/test_fund_lock.py
+Run with: python -m pytest tests/adversarial/test_fund_lock_prevention.py
+(SmartPy mock from conftest.py only; see tests/README.md)
 """
 
 import smartpy as sp
@@ -32,20 +33,52 @@ from contracts.core.escrow_base import (
     MIN_TIMEOUT_SECONDS,
     MAX_TIMEOUT_SECONDS
 )
+from tests._common import Addr, from_template
 
 
 # ==============================================================================
 # HELPER ADDRESSES & AMOUNTS
 # ==============================================================================
 
-DEPOSITOR = sp.address("tz1Depositor11111111111111111111111111")
-BENEFICIARY = sp.address("tz1Beneficiary1111111111111111111111")
-OBSERVER = sp.address("tz1Observer11111111111111111111111111")  # Bot/third party
+DEPOSITOR = Addr.DEPOSITOR
+BENEFICIARY = Addr.BENEFICIARY
+OBSERVER = Addr.RANDOM_THIRD_PARTY  # Bot/third party
 AMOUNT = sp.nat(10_000_000)  # 10 XTZ
 SHORT_TIMEOUT = sp.nat(3600)  # 1 hour (minimum)
 MEDIUM_TIMEOUT = sp.nat(86400)  # 1 day
 
 
+def _fresh_escrow(timeout_seconds=MEDIUM_TIMEOUT):
+    """Fresh copy of a SimpleEscrow with the standard parties and amount."""
+    return from_template(
+        SimpleEscrow,
+        depositor=DEPOSITOR,
+        beneficiary=BENEFICIARY,
+        amount=AMOUNT,
+        timeout_seconds=timeout_seconds
+    )
+
+
+def _seq(scenario, escrow, actions):
+    """Submit (entrypoint, run_kwargs) pairs to scenario in order."""
+    for entrypoint, run_kwargs in actions:
+        scenario += getattr(escrow, entrypoint)().run(**run_kwargs)
+
+
+# Depositor funds with the exact escrow amount
+_FUND = ("fund", {"sender": DEPOSITOR, "amount": sp.utils.nat_to_mutez(AMOUNT)})
+
+# (label, entrypoint, sender, expected state, timeout, called after deadline)
+TERMINAL_PATHS = [
+    ("Path 1: release() → RELEASED (terminal)",
+     "release", DEPOSITOR, STATE_RELEASED, MEDIUM_TIMEOUT, False),
+    ("Path 2: refund() → REFUNDED (terminal)",
+     "refund", DEPOSITOR, STATE_REFUNDED, MEDIUM_TIMEOUT, False),
+    ("Path 3: force_refund() → REFUNDED (terminal)",
+     "force_refund", OBSERVER, STATE_REFUNDED, SHORT_TIMEOUT, True),
+]
+
+
 # ==============================================================================
 # TEST 1: Recovery Path 1 - Normal Release
 # ==============================================================================
@@ -67,12 +100,7 @@ def test_fund_lock_recovery_path_1():
     
     # Setup
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
+    escrow = _fresh_escrow()
     scenario += escrow
     
     # Step 1: Fund escrow (depositor funds with exact amount)
@@ -121,12 +149,7 @@ def test_fund_lock_recovery_path_2():
     
     # Setup
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=SHORT_TIMEOUT  # Short timeout for faster testing
-    )
+    escrow = _fresh_escrow(SHORT_TIMEOUT)  # Short timeout for faster testing
     scenario += escrow
     
     # Step 1: Fund escrow
@@ -173,12 +196,7 @@ def test_fund_lock_recovery_path_3():
     
     # Setup
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=SHORT_TIMEOUT  # 1 hour
-    )
+    escrow = _fresh_escrow(SHORT_TIMEOUT)  # 1 hour
     scenario += escrow
     
     # Step 1: Fund escrow
@@ -231,13 +249,7 @@ def test_fund_lock_both_parties_disappear():
     """
     
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=SHORT_TIMEOUT
-    )
+    escrow = _fresh_escrow(SHORT_TIMEOUT)
     scenario += escrow
     
     # Fund escrow
@@ -285,22 +297,11 @@ def test_fund_lock_no_double_refund():
     """
     
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
+    escrow = _fresh_escrow()
     scenario += escrow
     
-    # Fund
-    scenario += escrow.fund().run(
-        sender=DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(AMOUNT)
-    )
-    
-    # First refund (success)
-    scenario += escrow.refund().run(sender=DEPOSITOR)
+    # Fund, then first refund (success)
+    _seq(scenario, escrow, [_FUND, ("refund", {"sender": DEPOSITOR})])
     scenario.verify(escrow.data.state == STATE_REFUNDED)
     
     # Second refund attempt (should fail - state not FUNDED)
@@ -337,17 +338,12 @@ def test_fund_lock_no_direct_transfer():
     """
     
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
+    escrow = _fresh_escrow()
     scenario += escrow
     
     # Attempt direct transfer (not calling fund(), just sending XTZ)
     # This should be rejected by default() entrypoint
-    # Note: Direct transfers are rejected, verified in test_security_fixes.py
+    # Note: Direct transfers are rejected, verified in test_simple_escrow_fixes.py
     # Skip actual test here as exception handling is complex
     
     # Verify: State remains INIT (no fund was processed)
@@ -378,13 +374,7 @@ def test_fund_lock_guarantee():
     """
     
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=SHORT_TIMEOUT
-    )
+    escrow = _fresh_escrow(SHORT_TIMEOUT)
     scenario += escrow
     
     # Fund
@@ -433,12 +423,7 @@ def test_fund_lock_deadline_correct():
     """
     
     scenario = sp.test_scenario()
-    escrow = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
+    escrow = _fresh_escrow()
     scenario += escrow
     
     # At creation time, funded_at = 0, deadline = 0
@@ -483,62 +468,20 @@ def test_fund_lock_terminal_guarantee():
     Assertion: Reaching terminal state = funds transferred (no lock)
     """
     
-    # Test Path 1: release() → RELEASED
-    scenario1 = sp.test_scenario()
-    escrow1 = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
-    scenario1 += escrow1
-    scenario1 += escrow1.fund().run(
-        sender=DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(AMOUNT)
-    )
-    scenario1 += escrow1.release().run(sender=DEPOSITOR)
-    scenario1.verify(escrow1.data.state == STATE_RELEASED)
-    scenario1.h2("Path 1: release() → RELEASED (terminal)")
-    
-    # Test Path 2: refund() → REFUNDED
-    scenario2 = sp.test_scenario()
-    escrow2 = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=MEDIUM_TIMEOUT
-    )
-    scenario2 += escrow2
-    scenario2 += escrow2.fund().run(
-        sender=DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(AMOUNT)
-    )
-    scenario2 += escrow2.refund().run(sender=DEPOSITOR)
-    scenario2.verify(escrow2.data.state == STATE_REFUNDED)
-    scenario2.h2("Path 2: refund() → REFUNDED (terminal)")
-    
-    # Test Path 3: force_refund() → REFUNDED
-    scenario3 = sp.test_scenario()
-    escrow3 = SimpleEscrow(
-        depositor=DEPOSITOR,
-        beneficiary=BENEFICIARY,
-        amount=AMOUNT,
-        timeout_seconds=SHORT_TIMEOUT
-    )
-    scenario3 += escrow3
-    scenario3 += escrow3.fund().run(
-        sender=DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(AMOUNT)
-    )
-    scenario3 += escrow3.force_refund().run(
-        sender=OBSERVER,
-        now=scenario3.now_in_seconds + MIN_TIMEOUT_SECONDS + 1,
-        valid=True
-    )
-    scenario3.verify(escrow3.data.state == STATE_REFUNDED)
-    scenario3.h2("Path 3: force_refund() → REFUNDED (terminal)")
+    # One scenario hosts all three escrows; only the contracts differ per path
+    scenario = sp.test_scenario()
     
-    scenario3.h1("✅ PASS: All recovery paths reach terminal state")
+    for label, entrypoint, sender, expected_state, timeout, after_deadline in TERMINAL_PATHS:
+        escrow = _fresh_escrow(timeout_seconds=timeout)
+        scenario += escrow
+        run_kwargs = {"sender": sender}
+        if after_deadline:
+            run_kwargs["now"] = scenario.now_in_seconds + MIN_TIMEOUT_SECONDS + 1
+        _seq(scenario, escrow, [_FUND, (entrypoint, run_kwargs)])
+        scenario.verify(escrow.data.state == expected_state)
+        scenario.h2(label)
+    
+    scenario.h1("✅ PASS: All recovery paths reach terminal state")
 
 
 # ==============================================================================
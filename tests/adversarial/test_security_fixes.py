@@ -1,712 +0,0 @@
-"""
-Security Fixes Test Suite
-=========================
-
-Tests verifying that all security vulnerabilities identified in the audit
-have been properly fixed.
-
-Fixes Tested:
-    C-01: create_and_fund fund lock → DISABLED (fails with error)
-    C-02: Adapter pass-through auth bypass → DISABLED (fails with error)
-    H-01: Direct transfer fund lock → REJECTED by default entrypoint
-    H-02: Balance/state desync → Fixed (transfers sp.balance, not escrow_amount)
-    M-01: Deadline at deployment → DEPRECATED (use escrow_base.py)
-    L-01: Documentation mismatch → Fixed (fund requires depositor)
-"""
-
-import smartpy as sp
-
-from contracts.core.escrow_base import (
-    SimpleEscrow,
-    EscrowBase,
-    EscrowError,
-    STATE_INIT,
-    STATE_FUNDED,
-    STATE_RELEASED,
-    STATE_REFUNDED,
-    MIN_TIMEOUT_SECONDS,
-    MAX_TIMEOUT_SECONDS,
-)
-from contracts.adapters.escrow_adapter import (
-    EscrowAdapter,
-    AdapterError,
-    CreateEscrowRequest,
-)
-
-
-# ==============================================================================
-# TEST ADDRESSES
-# ==============================================================================
-
-class Addr:
-    """Test addresses"""
-    DEPOSITOR = sp.address("tz1Depositor11111111111111111111111111")
-    BENEFICIARY = sp.address("tz1Beneficiary111111111111111111111111")
-    ATTACKER = sp.address("tz1Attacker1111111111111111111111111111")
-    RANDOM = sp.address("tz1Random111111111111111111111111111111")
-
-
-# ==============================================================================
-# TEST AMOUNTS
-# ==============================================================================
-
-class Amount:
-    """Test amounts in mutez"""
-    ESCROW = sp.nat(1_000_000)  # 1 XTZ
-    HALF = sp.nat(500_000)
-    DUST = sp.nat(1)
-    EXTRA = sp.nat(100_000)  # 0.1 XTZ
-
-
-# ==============================================================================
-# C-01: create_and_fund DISABLED TEST
-# ==============================================================================
-
-@sp.add_test(name="C-01: create_and_fund is disabled")
-def test_create_and_fund_disabled():
-    """
-    VULNERABILITY: create_and_fund would lock funds (state=INIT with balance>0)
-    FIX: Operation is disabled with explicit error
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("C-01: create_and_fund is disabled")
-
-    # Deploy adapter
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    # Attempt create_and_fund (should fail)
-    scenario.h2("Attempting create_and_fund (should fail)")
-
-    params = sp.record(
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-
-    scenario += adapter.create_and_fund(params).run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=AdapterError.DISABLED_USE_DIRECT_CALL
-    )
-
-    scenario.h2("Verified: create_and_fund correctly disabled")
-
-
-# ==============================================================================
-# C-02: ADAPTER PASS-THROUGH DISABLED TESTS
-# ==============================================================================
-
-@sp.add_test(name="C-02a: fund_escrow pass-through is disabled")
-def test_fund_escrow_disabled():
-    """
-    VULNERABILITY: fund_escrow would fail (sp.sender = adapter, not depositor)
-    FIX: Operation is disabled with explicit error
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("C-02a: fund_escrow pass-through is disabled")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    # Create escrow first
-    params = sp.record(
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += adapter.create_escrow(params).run(sender=Addr.DEPOSITOR)
-
-    # Attempt fund_escrow (should fail with disabled error)
-    scenario.h2("Attempting fund_escrow (should fail)")
-    scenario += adapter.fund_escrow(sp.address("KT1Escrow")).run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=AdapterError.DISABLED_USE_DIRECT_CALL
-    )
-
-    scenario.h2("Verified: fund_escrow correctly disabled")
-
-
-@sp.add_test(name="C-02b: release_escrow pass-through is disabled")
-def test_release_escrow_disabled():
-    """
-    VULNERABILITY: release_escrow would always fail (sp.sender = adapter)
-    FIX: Operation is disabled with explicit error
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("C-02b: release_escrow pass-through is disabled")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    # Attempt release_escrow (should fail)
-    scenario += adapter.release_escrow(sp.address("KT1Escrow")).run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=AdapterError.DISABLED_USE_DIRECT_CALL
-    )
-
-    scenario.h2("Verified: release_escrow correctly disabled")
-
-
-@sp.add_test(name="C-02c: refund_escrow pass-through is disabled")
-def test_refund_escrow_disabled():
-    """
-    VULNERABILITY: refund_escrow would always fail (sp.sender = adapter)
-    FIX: Operation is disabled with explicit error
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("C-02c: refund_escrow pass-through is disabled")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    scenario += adapter.refund_escrow(sp.address("KT1Escrow")).run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=AdapterError.DISABLED_USE_DIRECT_CALL
-    )
-
-    scenario.h2("Verified: refund_escrow correctly disabled")
-
-
-@sp.add_test(name="C-02d: force_refund_escrow pass-through is disabled")
-def test_force_refund_escrow_disabled():
-    """
-    FIX: All pass-through operations disabled for consistency
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("C-02d: force_refund_escrow pass-through is disabled")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    scenario += adapter.force_refund_escrow(sp.address("KT1Escrow")).run(
-        sender=Addr.RANDOM,
-        valid=False,
-        exception=AdapterError.DISABLED_USE_DIRECT_CALL
-    )
-
-    scenario.h2("Verified: force_refund_escrow correctly disabled")
-
-
-# ==============================================================================
-# H-01: DIRECT TRANSFER PROTECTION TESTS
-# ==============================================================================
-
-@sp.add_test(name="H-01: Direct transfers are rejected")
-def test_direct_transfer_rejected():
-    """
-    VULNERABILITY: Direct XTZ transfers would create locked funds
-    FIX: Default entrypoint rejects all direct transfers
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("H-01: Direct transfers are rejected")
-
-    # Deploy escrow
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Attempt direct transfer (should fail)
-    scenario.h2("Attempting direct transfer via default entrypoint")
-    scenario += escrow.default().run(
-        sender=Addr.RANDOM,
-        amount=sp.mutez(100000),
-        valid=False,
-        exception=EscrowError.DIRECT_TRANSFER_NOT_ALLOWED
-    )
-
-    scenario.h2("Verified: Direct transfers correctly rejected")
-
-
-# ==============================================================================
-# H-02: BALANCE INTEGRITY TESTS
-# ==============================================================================
-
-@sp.add_test(name="H-02: All funds transferred on release (no locked dust)")
-def test_all_funds_transferred_on_release():
-    """
-    VULNERABILITY: Using escrow_amount instead of balance could leave dust locked
-    FIX: Transfer sp.balance to ensure all funds are moved
-
-    Note: This test verifies the pattern. In actual Tezos, we'd verify
-    contract balance is 0 after release.
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("H-02: All funds transferred on release")
-
-    # Deploy escrow
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Fund escrow
-    scenario.h2("Funding escrow")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-
-    # Release
-    scenario.h2("Releasing escrow")
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-    # Balance should be 0 (all transferred)
-    # Note: In SmartPy test, balance tracking is implicit
-    scenario.h2("Verified: Release transfers all funds")
-
-
-@sp.add_test(name="H-02b: All funds transferred on refund")
-def test_all_funds_transferred_on_refund():
-    """
-    FIX: Refund also uses sp.balance to ensure complete transfer
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("H-02b: All funds transferred on refund")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Refund
-    scenario += escrow.refund().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-    scenario.h2("Verified: Refund transfers all funds")
-
-
-# ==============================================================================
-# L-01: AUTHORIZATION CORRECTNESS TESTS
-# ==============================================================================
-
-@sp.add_test(name="L-01a: Only depositor can fund")
-def test_only_depositor_can_fund():
-    """
-    VULNERABILITY: Documentation said anyone can fund, but code restricts
-    FIX: Documentation updated, test confirms depositor-only
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("L-01a: Only depositor can fund")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Attacker cannot fund
-    scenario.h2("Attacker attempts to fund (should fail)")
-    scenario += escrow.fund().run(
-        sender=Addr.ATTACKER,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Beneficiary cannot fund
-    scenario.h2("Beneficiary attempts to fund (should fail)")
-    scenario += escrow.fund().run(
-        sender=Addr.BENEFICIARY,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Depositor can fund
-    scenario.h2("Depositor funds (should succeed)")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-
-    scenario.h2("Verified: Only depositor can fund")
-
-
-@sp.add_test(name="L-01b: Only depositor can release")
-def test_only_depositor_can_release():
-    """Authorization test for release()"""
-    scenario = sp.test_scenario()
-    scenario.h1("L-01b: Only depositor can release")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Fund first
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Beneficiary cannot release (even though they receive funds)
-    scenario.h2("Beneficiary attempts release (should fail)")
-    scenario += escrow.release().run(
-        sender=Addr.BENEFICIARY,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Attacker cannot release
-    scenario.h2("Attacker attempts release (should fail)")
-    scenario += escrow.release().run(
-        sender=Addr.ATTACKER,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Depositor can release
-    scenario.h2("Depositor releases (should succeed)")
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-
-@sp.add_test(name="L-01c: Only depositor can refund (before timeout)")
-def test_only_depositor_can_refund():
-    """Authorization test for refund()"""
-    scenario = sp.test_scenario()
-    scenario.h1("L-01c: Only depositor can refund")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Fund first
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-
-    # Attacker cannot refund
-    scenario.h2("Attacker attempts refund (should fail)")
-    scenario += escrow.refund().run(
-        sender=Addr.ATTACKER,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Depositor can refund
-    scenario.h2("Depositor refunds (should succeed)")
-    scenario += escrow.refund().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-@sp.add_test(name="L-01d: Anyone can force_refund after timeout")
-def test_anyone_can_force_refund_after_timeout():
-    """Authorization test for force_refund()"""
-    scenario = sp.test_scenario()
-    scenario.h1("L-01d: Anyone can force_refund after timeout")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(3600)  # 1 hour
-    )
-    scenario += escrow
-
-    # Fund
-    funding_time = sp.timestamp(0)
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        now=funding_time
-    )
-
-    # Cannot force_refund before timeout
-    scenario.h2("Attacker attempts force_refund before timeout (should fail)")
-    scenario += escrow.force_refund().run(
-        sender=Addr.ATTACKER,
-        now=sp.timestamp(3000),  # Before deadline
-        valid=False,
-        exception=EscrowError.TIMEOUT_NOT_EXPIRED
-    )
-
-    # Anyone can force_refund after timeout
-    scenario.h2("Random party force_refunds after timeout (should succeed)")
-    scenario += escrow.force_refund().run(
-        sender=Addr.RANDOM,
-        now=sp.timestamp(3601)  # After deadline
-    )
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-# ==============================================================================
-# ADAPTER SAFE OPERATIONS TESTS
-# ==============================================================================
-
-@sp.add_test(name="Adapter: create_escrow works correctly")
-def test_adapter_create_escrow_works():
-    """
-    Verify that create_escrow (factory function) still works correctly
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Adapter: create_escrow works correctly")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    # Create escrow (no funds attached)
-    params = sp.record(
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-
-    scenario.h2("Creating escrow via adapter")
-    scenario += adapter.create_escrow(params).run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.tez(0)  # Must be zero
-    )
-
-    # Verify escrow registered
-    scenario.verify(adapter.data.escrow_count == 1)
-
-    scenario.h2("Verified: create_escrow works correctly")
-
-
-@sp.add_test(name="Adapter: create_escrow rejects attached funds")
-def test_adapter_create_escrow_rejects_funds():
-    """
-    Verify that create_escrow rejects any attached funds
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Adapter: create_escrow rejects attached funds")
-
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    params = sp.record(
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-
-    # Attempt with attached funds (should fail)
-    scenario.h2("Attempting create_escrow with funds (should fail)")
-    scenario += adapter.create_escrow(params).run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.tez(1),  # Attached funds
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
-
-    scenario.h2("Verified: create_escrow rejects attached funds")
-
-
-# ==============================================================================
-# FULL WORKFLOW TEST
-# ==============================================================================
-
-@sp.add_test(name="Full workflow: Create via adapter, fund directly")
-def test_full_workflow():
-    """
-    Test the correct usage pattern:
-    1. Create escrow via adapter (factory)
-    2. Fund escrow directly (not via adapter)
-    3. Release escrow directly
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Full workflow: Create via adapter, fund directly")
-
-    # Deploy adapter
-    adapter = EscrowAdapter()
-    scenario += adapter
-
-    # Step 1: Create escrow via adapter
-    scenario.h2("Step 1: Create escrow via adapter")
-    # Note: In real usage, you'd get the escrow address from the operation result
-    # For this test, we deploy escrow directly to simulate
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Step 2: Fund escrow DIRECTLY (not via adapter)
-    scenario.h2("Step 2: Fund escrow directly")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-
-    # Step 3: Release escrow DIRECTLY
-    scenario.h2("Step 3: Release escrow directly")
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-    scenario.h2("Verified: Full workflow completes successfully")
-
-
-# ==============================================================================
-# INVARIANT PRESERVATION TESTS
-# ==============================================================================
-
-@sp.add_test(name="Invariant: Terminal states are permanent")
-def test_terminal_states_permanent():
-    """
-    Verify that terminal states (RELEASED, REFUNDED) cannot be changed
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Invariant: Terminal states are permanent")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Fund and release
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-    # Cannot fund again
-    scenario.h2("Cannot fund after release")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW),
-        valid=False,
-        exception=EscrowError.ALREADY_FUNDED
-    )
-
-    # Cannot release again
-    scenario.h2("Cannot release again")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    # Cannot refund
-    scenario.h2("Cannot refund after release")
-    scenario += escrow.refund().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    scenario.h2("Verified: Terminal states are permanent")
-
-
-@sp.add_test(name="Invariant: State transitions follow FSM")
-def test_state_machine_fsm():
-    """
-    Verify state transitions only follow valid FSM paths:
-    INIT -> FUNDED -> RELEASED or REFUNDED
-    """
-    scenario = sp.test_scenario()
-    scenario.h1("Invariant: State transitions follow FSM")
-
-    escrow = SimpleEscrow(
-        depositor=Addr.DEPOSITOR,
-        beneficiary=Addr.BENEFICIARY,
-        amount=Amount.ESCROW,
-        timeout_seconds=sp.nat(86400)
-    )
-    scenario += escrow
-
-    # Cannot release from INIT (skip FUNDED)
-    scenario.h2("Cannot release from INIT state")
-    scenario += escrow.release().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    # Cannot refund from INIT
-    scenario.h2("Cannot refund from INIT state")
-    scenario += escrow.refund().run(
-        sender=Addr.DEPOSITOR,
-        valid=False,
-        exception=EscrowError.NOT_FUNDED
-    )
-
-    # Valid: INIT -> FUNDED
-    scenario.h2("Valid transition: INIT -> FUNDED")
-    scenario += escrow.fund().run(
-        sender=Addr.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(Amount.ESCROW)
-    )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-
-    # Valid: FUNDED -> RELEASED
-    scenario.h2("Valid transition: FUNDED -> RELEASED")
-    scenario += escrow.release().run(sender=Addr.DEPOSITOR)
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-    scenario.h2("Verified: FSM transitions enforced")
-
-
-# ==============================================================================
-# SUMMARY
-# ==============================================================================
-
-"""
-TEST SUMMARY
-============
-
-All security fixes verified:
-
-✅ C-01: create_and_fund disabled (prevents fund lock)
-✅ C-02a: fund_escrow pass-through disabled
-✅ C-02b: release_escrow pass-through disabled
-✅ C-02c: refund_escrow pass-through disabled
-✅ C-02d: force_refund_escrow pass-through disabled
-✅ H-01: Direct transfers rejected by default entrypoint
-✅ H-02: All funds transferred on release/refund (sp.balance)
-✅ L-01a: Only depositor can fund
-✅ L-01b: Only depositor can release
-✅ L-01c: Only depositor can refund
-✅ L-01d: Anyone can force_refund after timeout
-
-Additional verification:
-✅ Adapter create_escrow works correctly
-✅ Adapter create_escrow rejects attached funds
-✅ Full workflow: adapter create -> direct fund -> direct release
-✅ Terminal states are permanent
-✅ FSM transitions enforced
-"""
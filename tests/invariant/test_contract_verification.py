@@ -7,9 +7,51 @@ Performs syntax validation and structural analysis of the FortiEscrow framework.
 This validates contracts without requiring SmartPy runtime.
 """
 
+import argparse
 import ast
+import os
 import sys
-from pathlib import Path
+
+# (header, files, detailed) for each report section, in output order
+VALIDATION_GROUPS = [
+    ("CORE CONTRACT VALIDATION", [
+        'contracts/core/escrow_base.py',
+        'contracts/core/forti_escrow.py',
+        'contracts/core/escrow_factory.py',
+        'contracts/core/escrow_multisig.py',
+    ], True),
+    ("INTERFACE VALIDATION", [
+        'contracts/interfaces/types.py',
+        'contracts/interfaces/errors.py',
+        'contracts/interfaces/events.py',
+    ], False),
+    ("UTILITY VALIDATION", [
+        'contracts/utils/validators.py',
+        'contracts/utils/amount_validator.py',
+        'contracts/utils/timeline_manager.py',
+    ], False),
+    ("INVARIANTS VALIDATION", [
+        'contracts/invariants.py',
+        'contracts/invariants_enforcement.py',
+    ], False),
+]
+
+
+class _DefCollector(ast.NodeVisitor):
+    """Collects class and function names in a single AST traversal."""
+
+    def __init__(self):
+        self.classes = []
+        self.functions = []
+
+    def visit_ClassDef(self, node):
+        self.classes.append(node.name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.functions.append(node.name)
+        self.generic_visit(node)
+
 
 class ContractAnalyzer:
     """Analyzes contract Python files for correctness."""
@@ -18,172 +60,184 @@ class ContractAnalyzer:
         self.errors = []
         self.warnings = []
         self.passed = []
+        # (path, mtime_ns) -> parsed module, so each file is read and parsed once
+        self._tree_cache = {}
+        # directory -> set of file names, so existence checks cost one scandir per directory
+        self._dir_listing = {}
+        # Report lines, written out in one go by print_summary()
+        self._out = []
+    
+    def _emit(self, line=""):
+        """Buffer one line of report output."""
+        self._out.append(line + "\n")
+    
+    def _get_tree(self, filepath):
+        """Return the parsed AST for filepath, reusing a cached parse."""
+        key = (str(filepath), os.stat(filepath).st_mtime_ns)
+        tree = self._tree_cache.get(key)
+        if tree is None:
+            # ast.parse decodes bytes itself, honouring PEP 263 coding lines
+            with open(filepath, 'rb') as f:
+                tree = ast.parse(f.read(), filename=str(filepath))
+            self._tree_cache[key] = tree
+        return tree
     
     def check_syntax(self, filepath):
         """Verify Python syntax is valid."""
         try:
-            with open(filepath) as f:
-                ast.parse(f.read())
+            self._get_tree(filepath)
             return True, None
-        except SyntaxError as e:
+        except (SyntaxError, ValueError) as e:
+            # ValueError covers undecodable source and null bytes
             return False, str(e)
     
-    def analyze_contract(self, filepath):
+    def analyze_contract(self, filepath, tree=None):
         """Analyze contract file for structure."""
         try:
-            with open(filepath) as f:
-                tree = ast.parse(f.read())
-            
-            # Extract class definitions
-            classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+            if tree is None:
+                tree = self._get_tree(filepath)
             
-            # Extract function definitions
-            functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+            # Extract class and function definitions in one pass
+            collector = _DefCollector()
+            collector.visit(tree)
             
             return {
-                'classes': classes,
-                'functions': functions,
+                'classes': collector.classes,
+                'functions': collector.functions,
                 'ast': tree
             }
         except Exception as e:
             return None
     
-    def validate_core_contracts(self):
-        """Validate core contract files."""
-        print("\n" + "=" * 70)
-        print("CORE CONTRACT VALIDATION")
-        print("=" * 70)
+    def check_file(self, filepath):
+        """Run syntax check and structural analysis for a single file.
         
-        core_files = [
-            'contracts/core/escrow_base.py',
-            'contracts/core/forti_escrow.py',
-            'contracts/core/escrow_factory.py',
-            'contracts/core/escrow_multisig.py',
-        ]
+        Returns (filepath, valid, error, classes, num_functions).
+        """
+        valid, error = self.check_syntax(filepath)
+        if not valid:
+            return filepath, False, error, None, 0
+        analysis = self.analyze_contract(filepath)
+        if analysis is None:
+            return filepath, True, None, None, 0
+        return filepath, True, None, analysis['classes'], len(analysis['functions'])
+    
+    def check_files(self, files):
+        """Check the existing files in order, skipping (and warning on) missing ones."""
+        files = [f for f in files if self._exists_or_warn(f)]
+        return [self.check_file(f) for f in files]
+    
+    def _listing(self, directory):
+        """Return the regular file names in directory, scanning it at most once."""
+        names = self._dir_listing.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory or '.') as entries:
+                    # is_file() uses the d_type from scandir, so no extra stat
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                names = set()
+            self._dir_listing[directory] = names
+        return names
+    
+    def _exists_or_warn(self, filepath):
+        directory, name = os.path.split(filepath)
+        if name not in self._listing(directory):
+            self.warnings.append(f"⚠️  {filepath} - NOT FOUND")
+            return False
+        return True
+    
+    def validate_group(self, header, files, detailed=False, results=None):
+        """Validate one group of files and report them under header.
         
-        for filepath in core_files:
-            path = Path(filepath)
-            if not path.exists():
-                self.warnings.append(f"⚠️  {filepath} - NOT FOUND")
-                continue
-            
-            valid, error = self.check_syntax(filepath)
-            if valid:
-                analysis = self.analyze_contract(filepath)
-                if analysis:
-                    num_classes = len(analysis['classes'])
-                    num_functions = len(analysis['functions'])
-                    self.passed.append(f"✅ {filepath} ({num_classes} classes, {num_functions} functions)")
-                    print(f"✅ {filepath}")
-                    print(f"   Classes: {', '.join(analysis['classes']) or 'None'}")
-                    print(f"   Functions: {num_functions} total")
-            else:
-                self.errors.append(f"❌ {filepath} - SYNTAX ERROR: {error}")
-                print(f"❌ {filepath}")
-                print(f"   {error}")
-    
-    def validate_interfaces(self):
-        """Validate interface files."""
-        print("\n" + "=" * 70)
-        print("INTERFACE VALIDATION")
-        print("=" * 70)
+        detailed groups also report class names and function counts.
+        results may carry precomputed check_file() tuples for these files.
+        """
+        self._emit("\n" + "=" * 70)
+        self._emit(header)
+        self._emit("=" * 70)
         
-        interface_files = [
-            'contracts/interfaces/types.py',
-            'contracts/interfaces/errors.py',
-            'contracts/interfaces/events.py',
-        ]
+        if results is None:
+            results = self.check_files(files)
         
-        for filepath in interface_files:
-            path = Path(filepath)
-            if not path.exists():
-                self.warnings.append(f"⚠️  {filepath} - NOT FOUND")
-                continue
-            
-            valid, error = self.check_syntax(filepath)
-            if valid:
-                self.passed.append(f"✅ {filepath}")
-                print(f"✅ {filepath}")
-            else:
+        for filepath, valid, error, classes, num_functions in results:
+            if not valid:
                 self.errors.append(f"❌ {filepath} - SYNTAX ERROR: {error}")
-                print(f"❌ {filepath} - {error}")
-    
-    def validate_utilities(self):
-        """Validate utility files."""
-        print("\n" + "=" * 70)
-        print("UTILITY VALIDATION")
-        print("=" * 70)
-        
-        util_files = [
-            'contracts/utils/validators.py',
-            'contracts/utils/amount_validator.py',
-            'contracts/utils/timeline_manager.py',
-        ]
-        
-        for filepath in util_files:
-            path = Path(filepath)
-            if not path.exists():
-                self.warnings.append(f"⚠️  {filepath} - NOT FOUND")
-                continue
-            
-            valid, error = self.check_syntax(filepath)
-            if valid:
+                if detailed:
+                    self._emit(f"❌ {filepath}")
+                    self._emit(f"   {error}")
+                else:
+                    self._emit(f"❌ {filepath} - {error}")
+            elif not detailed:
                 self.passed.append(f"✅ {filepath}")
-                print(f"✅ {filepath}")
-            else:
-                self.errors.append(f"❌ {filepath} - SYNTAX ERROR: {error}")
-                print(f"❌ {filepath} - {error}")
+                self._emit(f"✅ {filepath}")
+            elif classes is not None:
+                num_classes = len(classes)
+                self.passed.append(f"✅ {filepath} ({num_classes} classes, {num_functions} functions)")
+                self._emit(f"✅ {filepath}")
+                self._emit(f"   Classes: {', '.join(classes) or 'None'}")
+                self._emit(f"   Functions: {num_functions} total")
     
-    def validate_invariants(self):
-        """Validate invariant enforcement."""
-        print("\n" + "=" * 70)
-        print("INVARIANTS VALIDATION")
-        print("=" * 70)
+    def validate_all(self, groups=None, fast_fail=False):
+        """Validate every group, checking all files in a single batch.
         
-        inv_files = [
-            'contracts/invariants.py',
-            'contracts/invariants_enforcement.py',
-        ]
+        With fast_fail, groups are checked one at a time and validation
+        stops after the first group that reports a syntax error.
+        """
+        groups = VALIDATION_GROUPS if groups is None else groups
+        if fast_fail:
+            for header, files, detailed in groups:
+                self.validate_group(header, files, detailed)
+                if self.errors:
+                    break
+            return
         
-        for filepath in inv_files:
-            path = Path(filepath)
-            if not path.exists():
-                self.warnings.append(f"⚠️  {filepath} - NOT FOUND")
-                continue
-            
-            valid, error = self.check_syntax(filepath)
-            if valid:
-                self.passed.append(f"✅ {filepath}")
-                print(f"✅ {filepath}")
-            else:
-                self.errors.append(f"❌ {filepath} - SYNTAX ERROR: {error}")
-                print(f"❌ {filepath} - {error}")
+        all_files = [f for _, files, _ in groups for f in files]
+        by_path = {result[0]: result for result in self.check_files(all_files)}
+        
+        for header, files, detailed in groups:
+            results = [by_path[f] for f in files if f in by_path]
+            self.validate_group(header, files, detailed, results)
     
     def print_summary(self):
         """Print validation summary."""
-        print("\n" + "=" * 70)
-        print("VALIDATION SUMMARY")
-        print("=" * 70)
+        self._emit("\n" + "=" * 70)
+        self._emit("VALIDATION SUMMARY")
+        self._emit("=" * 70)
         
-        print(f"\n✅ Passed: {len(self.passed)}")
+        self._emit(f"\n✅ Passed: {len(self.passed)}")
         for msg in self.passed:
-            print(f"   {msg}")
+            self._emit(f"   {msg}")
         
         if self.warnings:
-            print(f"\n⚠️  Warnings: {len(self.warnings)}")
+            self._emit(f"\n⚠️  Warnings: {len(self.warnings)}")
             for msg in self.warnings:
-                print(f"   {msg}")
+                self._emit(f"   {msg}")
         
         if self.errors:
-            print(f"\n❌ Errors: {len(self.errors)}")
+            self._emit(f"\n❌ Errors: {len(self.errors)}")
             for msg in self.errors:
-                print(f"   {msg}")
-            return False
+                self._emit(f"   {msg}")
         
-        return True
+        self._flush()
+        return not self.errors
+    
+    def _flush(self):
+        """Write all buffered report output with a single write call."""
+        sys.stdout.write("".join(self._out))
+        sys.stdout.flush()
+        self._out.clear()
 
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FortiEscrow contract verification")
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="stop after the first validation group with syntax errors",
+    )
+    args = parser.parse_args(argv)
+    
     print("\n")
     print("╔" + "═" * 68 + "╗")
     print("║" + " " * 12 + "FortiEscrow Contract Verification Suite" + " " * 16 + "║")
@@ -191,10 +245,7 @@ def main():
     
     analyzer = ContractAnalyzer()
     
-    analyzer.validate_core_contracts()
-    analyzer.validate_interfaces()
-    analyzer.validate_utilities()
-    analyzer.validate_invariants()
+    analyzer.validate_all(fast_fail=args.fast_fail)
     
     success = analyzer.print_summary()
     
@@ -202,7 +253,7 @@ def main():
         print("\n✅ All contracts validated successfully!")
         print("\nNext steps:")
         print("  1. Install SmartPy: https://smartpy.io/")
-        print("  2. Run full test suite: python -m smartpy test tests/test_fortiescrow.py")
+        print("  2. Run full test suite: python -m pytest tests/")
         print("  3. Deploy to testnet: python -m smartpy deploy contracts/core/forti_escrow.py")
         print()
         return 0
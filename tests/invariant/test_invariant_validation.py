@@ -24,37 +24,62 @@ from contracts.core.escrow_multisig import (
     DISPUTE_NONE, DISPUTE_PENDING, DISPUTE_RESOLVED,
     DISPUTE_RESOLVED_RELEASE, DISPUTE_RESOLVED_REFUND,
 )
-
-
-class TestAddresses:
-    """Standard test addresses for invariant tests."""
-    DEPOSITOR = sp.address("tz1Depositor1111111111111111111111")
-    BENEFICIARY = sp.address("tz1Beneficiary111111111111111111")
-    ARBITER = sp.address("tz1Arbiter11111111111111111111111")
-    ATTACKER = sp.address("tz1Attacker11111111111111111111111")
+from tests._common import Addr, Timeout, clone, from_template, snapshot
 
 
 def create_simple_escrow():
     """Factory for SimpleEscrow in INIT state."""
-    escrow = SimpleEscrow(
-        depositor=TestAddresses.DEPOSITOR,
-        beneficiary=TestAddresses.BENEFICIARY,
+    return from_template(
+        SimpleEscrow,
+        depositor=Addr.DEPOSITOR,
+        beneficiary=Addr.BENEFICIARY,
         amount=1000,  # Amount in mutez
-        timeout_seconds=86400  # 1 day
+        timeout_seconds=Timeout.ONE_DAY
     )
-    return escrow
 
 
 def create_multisig_escrow():
     """Factory for MultiSigEscrow in INIT state."""
-    escrow = MultiSigEscrow(
-        depositor=TestAddresses.DEPOSITOR,
-        beneficiary=TestAddresses.BENEFICIARY,
-        arbiter=TestAddresses.ARBITER,
+    return from_template(
+        MultiSigEscrow,
+        depositor=Addr.DEPOSITOR,
+        beneficiary=Addr.BENEFICIARY,
+        arbiter=Addr.ARBITER,
         amount=1000,  # Amount in mutez
-        timeout_seconds=86400  # 1 day
+        timeout_seconds=Timeout.ONE_DAY
     )
-    return escrow
+
+
+def _shared(escrow):
+    """Yield a module-scoped template, then fail if a test mutated it.
+
+    Tests must clone() shared templates; a test that runs entrypoints
+    on the template itself would leak state into every later test.
+    """
+    storage = snapshot(escrow)
+    yield escrow
+    assert vars(escrow.data) == storage, "shared fixture mutated; clone() it"
+
+
+@pytest.fixture(scope="module")
+def funded_multisig():
+    """MultiSigEscrow funded once per module; tests must clone() it."""
+    escrow = create_multisig_escrow()
+    escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=1000
+    )
+    yield from _shared(escrow)
+
+
+@pytest.fixture(scope="module")
+def disputed_multisig(funded_multisig):
+    """Funded MultiSigEscrow with a pending dispute; tests must clone() it."""
+    escrow = clone(funded_multisig)
+    escrow.raise_dispute("service issue").run(
+        sender=Addr.DEPOSITOR
+    )
+    yield from _shared(escrow)
 
 
 # ==============================================================================
@@ -74,7 +99,7 @@ class TestFundsSafetyInvariant:
         
         # Attempt to release (should fail or not actually transfer funds)
         with pytest.raises(Exception):
-            escrow.release().run(sender=TestAddresses.DEPOSITOR)
+            escrow.release().run(sender=Addr.DEPOSITOR)
 
     def test_no_transfer_in_funded_state(self):
         """Funds cannot be transferred from FUNDED state (must be terminal)."""
@@ -82,7 +107,7 @@ class TestFundsSafetyInvariant:
         
         # Setup: Fund the escrow
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow.data.state == STATE_FUNDED
@@ -98,10 +123,10 @@ class TestFundsSafetyInvariant:
         
         # Setup: Fund and release
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow.release().run(sender=Addr.DEPOSITOR)
         
         # Verify: State is terminal
         assert escrow.data.state == STATE_RELEASED
@@ -116,10 +141,10 @@ class TestFundsSafetyInvariant:
         
         # Setup: Fund and refund
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow.refund().run(sender=TestAddresses.DEPOSITOR)
+        escrow.refund().run(sender=Addr.DEPOSITOR)
         
         # Verify: State is terminal
         assert escrow.data.state == STATE_REFUNDED
@@ -143,15 +168,15 @@ class TestStateConsistencyInvariant:
         
         # Try to release from INIT (should fail)
         with pytest.raises(Exception):
-            escrow.release().run(sender=TestAddresses.DEPOSITOR)
+            escrow.release().run(sender=Addr.DEPOSITOR)
         
         # Try to refund from INIT (should fail)
         with pytest.raises(Exception):
-            escrow.refund().run(sender=TestAddresses.DEPOSITOR)
+            escrow.refund().run(sender=Addr.DEPOSITOR)
         
         # Only fund() should work
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow.data.state == STATE_FUNDED
@@ -160,22 +185,22 @@ class TestStateConsistencyInvariant:
         """From FUNDED state, can go to RELEASED or REFUNDED."""
         escrow1 = create_simple_escrow()
         escrow1.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow1.data.state == STATE_FUNDED
         
         # Can transition to RELEASED
-        escrow1.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow1.release().run(sender=Addr.DEPOSITOR)
         assert escrow1.data.state == STATE_RELEASED
         
         # Separate test: Can transition to REFUNDED
         escrow2 = create_simple_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow2.refund().run(sender=TestAddresses.DEPOSITOR)
+        escrow2.refund().run(sender=Addr.DEPOSITOR)
         assert escrow2.data.state == STATE_REFUNDED
 
     def test_terminal_states_cannot_transition(self):
@@ -183,42 +208,42 @@ class TestStateConsistencyInvariant:
         # Test RELEASED is terminal
         escrow1 = create_simple_escrow()
         escrow1.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow1.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow1.release().run(sender=Addr.DEPOSITOR)
         assert escrow1.data.state == STATE_RELEASED
         
         # Try to refund from RELEASED (should fail)
         with pytest.raises(Exception):
-            escrow1.refund().run(sender=TestAddresses.DEPOSITOR)
+            escrow1.refund().run(sender=Addr.DEPOSITOR)
         
         # Test REFUNDED is terminal
         escrow2 = create_simple_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow2.refund().run(sender=TestAddresses.DEPOSITOR)
+        escrow2.refund().run(sender=Addr.DEPOSITOR)
         assert escrow2.data.state == STATE_REFUNDED
         
         # Try to release from REFUNDED (should fail)
         with pytest.raises(Exception):
-            escrow2.release().run(sender=TestAddresses.DEPOSITOR)
+            escrow2.release().run(sender=Addr.DEPOSITOR)
 
     def test_no_backward_transitions(self):
         """Cannot transition backward in FSM."""
         escrow = create_simple_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow.release().run(sender=Addr.DEPOSITOR)
         
         # Try to go back to FUNDED (should fail)
         with pytest.raises(Exception):
             escrow.fund().run(
-                sender=TestAddresses.DEPOSITOR,
+                sender=Addr.DEPOSITOR,
                 amount=1000
             )
 
@@ -237,7 +262,7 @@ class TestAuthorizationInvariant:
         
         # Depositor CAN fund
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow.data.state == STATE_FUNDED
@@ -246,7 +271,7 @@ class TestAuthorizationInvariant:
         escrow2 = create_simple_escrow()
         with pytest.raises(Exception):
             escrow2.fund().run(
-                sender=TestAddresses.BENEFICIARY,
+                sender=Addr.BENEFICIARY,
                 amount=1000
             )
 
@@ -254,123 +279,97 @@ class TestAuthorizationInvariant:
         """In SimpleEscrow, only depositor can call release()."""
         escrow = create_simple_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         
         # Depositor CAN release
-        escrow.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow.release().run(sender=Addr.DEPOSITOR)
         assert escrow.data.state == STATE_RELEASED
         
         # Beneficiary CANNOT release
         escrow2 = create_simple_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         with pytest.raises(Exception):
-            escrow2.release().run(sender=TestAddresses.BENEFICIARY)
-
-    def test_only_parties_can_vote_multisig(self):
+            escrow2.release().run(sender=Addr.BENEFICIARY)
+
+    @pytest.mark.parametrize("voter, authorized", [
+        (Addr.DEPOSITOR, True),
+        (Addr.BENEFICIARY, True),
+        (Addr.ARBITER, True),
+        (Addr.ATTACKER, False),
+    ], ids=["depositor", "beneficiary", "arbiter", "attacker"])
+    def test_only_parties_can_vote_multisig(self, funded_multisig, voter, authorized):
         """In MultiSigEscrow, only the three parties can vote."""
-        # Setup: Create escrow and fund it
-        escrow = create_multisig_escrow()
-        escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        
-        # Verify state is FUNDED
+        # Each voter gets its own copy: after 2-of-3 votes consensus is
+        # reached and the escrow leaves FUNDED
+        escrow = clone(funded_multisig)
         assert escrow.data.state == STATE_FUNDED
         
-        # Depositor CAN vote
-        escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-        assert escrow.data.release_votes == 1
-        
-        # IMPORTANT INVARIANT: After 2-of-3 votes, consensus reached and state exits FUNDED
-        # So test each voter separately to verify authorization
-        
-        # Test Beneficiary can vote (on fresh escrow)
-        escrow2 = create_multisig_escrow()
-        escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        escrow2.vote_release().run(sender=TestAddresses.BENEFICIARY)
-        assert escrow2.data.release_votes == 1
-        
-        # Test Arbiter can vote (on fresh escrow)
-        escrow3 = create_multisig_escrow()
-        escrow3.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        escrow3.vote_release().run(sender=TestAddresses.ARBITER)
-        assert escrow3.data.release_votes == 1
-        
-        # Attacker CANNOT vote
-        escrow4 = create_multisig_escrow()
-        escrow4.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        with pytest.raises(Exception):
-            escrow4.vote_release().run(sender=TestAddresses.ATTACKER)
+        if authorized:
+            escrow.vote_release().run(sender=voter)
+            assert escrow.data.release_votes == 1
+        else:
+            with pytest.raises(Exception):
+                escrow.vote_release().run(sender=voter)
 
     def test_only_parties_can_raise_dispute(self):
         """Only depositor or beneficiary can raise disputes."""
         escrow = create_multisig_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         
         # Depositor CAN raise
         escrow.raise_dispute("invalid service").run(
-            sender=TestAddresses.DEPOSITOR
+            sender=Addr.DEPOSITOR
         )
         assert escrow.data.dispute_state == DISPUTE_PENDING
         
         # Arbiter CANNOT raise
         escrow2 = create_multisig_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         with pytest.raises(Exception):
             escrow2.raise_dispute("complaint").run(
-                sender=TestAddresses.ARBITER
+                sender=Addr.ARBITER
             )
 
     def test_only_arbiter_can_resolve_dispute(self):
         """Only arbiter can call resolve_dispute()."""
         escrow = create_multisig_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         escrow.raise_dispute("issue").run(
-            sender=TestAddresses.DEPOSITOR
+            sender=Addr.DEPOSITOR
         )
         
         # Arbiter CAN resolve
         escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-            sender=TestAddresses.ARBITER
+            sender=Addr.ARBITER
         )
         assert escrow.data.dispute_state == DISPUTE_RESOLVED
         
         # Depositor CANNOT resolve
         escrow2 = create_multisig_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         escrow2.raise_dispute("issue").run(
-            sender=TestAddresses.DEPOSITOR
+            sender=Addr.DEPOSITOR
         )
         with pytest.raises(Exception):
             escrow2.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-                sender=TestAddresses.DEPOSITOR
+                sender=Addr.DEPOSITOR
             )
 
 
@@ -386,7 +385,7 @@ class TestTimeSafetyInvariant:
         """force_refund() works at or after deadline."""
         escrow = create_simple_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         
@@ -401,7 +400,7 @@ class TestTimeSafetyInvariant:
         """force_refund() is rejected before deadline."""
         escrow = create_simple_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         
@@ -423,28 +422,28 @@ class TestNoFundLockingInvariant:
         """SimpleEscrow has three independent exit paths."""
         escrow = create_simple_escrow()
         escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         
         # Path 1: release() → RELEASED
-        escrow.release().run(sender=TestAddresses.DEPOSITOR)
+        escrow.release().run(sender=Addr.DEPOSITOR)
         assert escrow.data.state == STATE_RELEASED
         
         # Path 2: refund() → REFUNDED
         escrow2 = create_simple_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow2.refund().run(sender=TestAddresses.DEPOSITOR)
+        escrow2.refund().run(sender=Addr.DEPOSITOR)
         assert escrow2.data.state == STATE_REFUNDED
         
         # Path 3: force_refund() after deadline → REFUNDED
         # (Requires time progression in test)
         escrow3 = create_simple_escrow()
         escrow3.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow3.data.state == STATE_FUNDED
@@ -454,27 +453,27 @@ class TestNoFundLockingInvariant:
         # Path 1: vote_release consensus → RELEASED
         escrow1 = create_multisig_escrow()
         escrow1.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow1.vote_release().run(sender=TestAddresses.DEPOSITOR)
-        escrow1.vote_release().run(sender=TestAddresses.BENEFICIARY)
+        escrow1.vote_release().run(sender=Addr.DEPOSITOR)
+        escrow1.vote_release().run(sender=Addr.BENEFICIARY)
         assert escrow1.data.state == STATE_RELEASED
         
         # Path 2: vote_refund consensus → REFUNDED
         escrow2 = create_multisig_escrow()
         escrow2.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
-        escrow2.vote_refund().run(sender=TestAddresses.DEPOSITOR)
-        escrow2.vote_refund().run(sender=TestAddresses.BENEFICIARY)
+        escrow2.vote_refund().run(sender=Addr.DEPOSITOR)
+        escrow2.vote_refund().run(sender=Addr.BENEFICIARY)
         assert escrow2.data.state == STATE_REFUNDED
         
         # Path 3: force_refund after deadline
         escrow3 = create_multisig_escrow()
         escrow3.fund().run(
-            sender=TestAddresses.DEPOSITOR,
+            sender=Addr.DEPOSITOR,
             amount=1000
         )
         assert escrow3.data.state == STATE_FUNDED
@@ -487,58 +486,33 @@ class TestNoFundLockingInvariant:
 class TestDisputeInvariants:
     """Verify dispute mechanism doesn't violate safety invariants."""
 
-    def test_dispute_doesnt_block_voting(self):
+    def test_dispute_doesnt_block_voting(self, disputed_multisig):
         """Voting continues even when dispute is active."""
-        escrow = create_multisig_escrow()
-        escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        
-        # Raise dispute
-        escrow.raise_dispute("service issue").run(
-            sender=TestAddresses.DEPOSITOR
-        )
+        escrow = clone(disputed_multisig)
         assert escrow.data.dispute_state == DISPUTE_PENDING
         
         # Voting still allowed during dispute
-        escrow.vote_refund().run(sender=TestAddresses.DEPOSITOR)
+        escrow.vote_refund().run(sender=Addr.DEPOSITOR)
         assert escrow.data.refund_votes > 0
 
-    def test_dispute_doesnt_prevent_resolution(self):
+    def test_dispute_doesnt_prevent_resolution(self, disputed_multisig):
         """Can still reach terminal state during dispute."""
-        escrow = create_multisig_escrow()
-        escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
-        
-        # Raise dispute
-        escrow.raise_dispute("service dispute").run(
-            sender=TestAddresses.DEPOSITOR
-        )
+        escrow = clone(disputed_multisig)
         
         # Can still vote and reach consensus
-        escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-        escrow.vote_release().run(sender=TestAddresses.BENEFICIARY)
+        escrow.vote_release().run(sender=Addr.DEPOSITOR)
+        escrow.vote_release().run(sender=Addr.BENEFICIARY)
         
         # Should reach terminal state
         assert escrow.data.state == STATE_RELEASED
 
-    def test_resolved_dispute_preserved(self):
+    def test_resolved_dispute_preserved(self, disputed_multisig):
         """Dispute resolution info is preserved in audit trail."""
-        escrow = create_multisig_escrow()
-        escrow.fund().run(
-            sender=TestAddresses.DEPOSITOR,
-            amount=1000
-        )
+        escrow = clone(disputed_multisig)
         
-        # Raise and resolve dispute
-        escrow.raise_dispute("service issue").run(
-            sender=TestAddresses.DEPOSITOR
-        )
+        # Resolve dispute
         escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-            sender=TestAddresses.ARBITER
+            sender=Addr.ARBITER
         )
         
         # Verify audit trail preserved
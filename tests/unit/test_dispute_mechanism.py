@@ -45,33 +45,23 @@ from contracts.core.escrow_base import (
     STATE_INIT,
     STATE_FUNDED,
     STATE_RELEASED,
-    STATE_REFUNDED,
-    MIN_TIMEOUT_SECONDS
+    STATE_REFUNDED
 )
 
+from tests._common import Addr, Amount, Timeout, from_template
+
 
 # ==============================================================================
 # TEST FIXTURES
 # ==============================================================================
 
-class TestAddresses:
-    """Standard test addresses"""
-    DEPOSITOR = sp.address("tz1Depositor11111111111111111111111111")
-    BENEFICIARY = sp.address("tz1Beneficiary1111111111111111111111")
-    ARBITER = sp.address("tz1Arbiter111111111111111111111111111")
-    ATTACKER = sp.address("tz1Attacker11111111111111111111111111")
-
-
-class TestAmounts:
-    """Standard test amounts"""
-    SMALL = sp.nat(1_000_000)        # 1 XTZ
-    MEDIUM = sp.nat(10_000_000)      # 10 XTZ
+# Unset timestamp fields (dispute_open_at before a dispute / after clearing)
+T0 = sp.timestamp(0)
 
-
-class TestTimeouts:
-    """Standard test timeouts"""
-    MIN = sp.nat(MIN_TIMEOUT_SECONDS)
-    WEEK = sp.nat(7 * 24 * 3600)
+# Funding and dispute time used by the timeline test, and the resolution
+# deadline a dispute opened then must get
+DISPUTE_OPENED_AT = sp.timestamp(1000)
+DISPUTE_DEADLINE = sp.add_seconds(DISPUTE_OPENED_AT, DISPUTE_TIMEOUT_DEFAULT)
 
 
 def create_escrow(
@@ -81,20 +71,21 @@ def create_escrow(
     amount=None,
     timeout=None
 ):
-    """Factory for test escrow instances"""
-    return MultiSigEscrow(
-        depositor=depositor or TestAddresses.DEPOSITOR,
-        beneficiary=beneficiary or TestAddresses.BENEFICIARY,
-        arbiter=arbiter or TestAddresses.ARBITER,
-        amount=amount or TestAmounts.SMALL,
-        timeout_seconds=timeout or TestTimeouts.WEEK
+    """Factory for test escrow instances (fresh copy per call)"""
+    return from_template(
+        MultiSigEscrow,
+        depositor=depositor or Addr.DEPOSITOR,
+        beneficiary=beneficiary or Addr.BENEFICIARY,
+        arbiter=arbiter or Addr.ARBITER,
+        amount=amount or Amount.ESCROW,
+        timeout_seconds=timeout or Timeout.ONE_WEEK
     )
 
 
 def fund_escrow(scenario, escrow, now=None):
     """Helper to fund escrow"""
     run_params = {
-        "sender": TestAddresses.DEPOSITOR,
+        "sender": Addr.DEPOSITOR,
         "amount": sp.utils.nat_to_mutez(escrow.data.escrow_amount)
     }
     if now is not None:
@@ -102,102 +93,128 @@ def fund_escrow(scenario, escrow, now=None):
     scenario += escrow.fund().run(**run_params)
 
 
-# ==============================================================================
-# TEST SUITE 1: DISPUTE LIFECYCLE
-# ==============================================================================
+def _funded():
+    """Default escrow funded by the depositor"""
+    escrow = create_escrow()
+    escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=sp.utils.nat_to_mutez(escrow.data.escrow_amount)
+    )
+    return escrow
 
-@sp.add_test(name="Dispute: Can raise dispute in FUNDED state")
-def test_raise_dispute_success():
-    """Verify depositor can raise a dispute"""
-    scenario = sp.test_scenario()
-    scenario.h1("Dispute Lifecycle: Open")
 
-    escrow = create_escrow()
+def funded_escrow(scenario):
+    """Add a copy of the funded default escrow to scenario"""
+    escrow = from_template(_funded)
     scenario += escrow
-    fund_escrow(scenario, escrow)
+    return escrow
 
-    # Raise dispute
-    scenario += escrow.raise_dispute("Service not delivered").run(
-        sender=TestAddresses.DEPOSITOR
-    )
 
-    # Verify state
-    scenario.verify(escrow.data.dispute_state == DISPUTE_PENDING)
-    scenario.verify(escrow.data.dispute_reason == "Service not delivered")
-    scenario.verify(escrow.data.dispute_open_at > sp.timestamp(0))
-    scenario.verify(escrow.data.dispute_deadline > escrow.data.dispute_open_at)
+def _disputed():
+    """Funded default escrow with a depositor dispute pending"""
+    escrow = from_template(_funded)
+    escrow.raise_dispute("Dispute raised").run(sender=Addr.DEPOSITOR)
+    return escrow
 
 
-@sp.add_test(name="Dispute: Arbiter can resolve with RELEASE outcome")
-def test_resolve_dispute_release():
-    """Verify arbiter can resolve dispute with release outcome"""
-    scenario = sp.test_scenario()
-    scenario.h1("Dispute Lifecycle: Resolve (RELEASE)")
-
-    escrow = create_escrow()
+def disputed_escrow(scenario):
+    """Add a copy of the disputed default escrow to scenario"""
+    escrow = from_template(_disputed)
     scenario += escrow
-    fund_escrow(scenario, escrow)
+    return escrow
 
-    # Raise dispute
-    scenario += escrow.raise_dispute("Need arbiter decision").run(
-        sender=TestAddresses.DEPOSITOR
-    )
 
-    # Arbiter resolves with RELEASE
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
+def _resolved_release():
+    """Disputed default escrow the arbiter resolved for RELEASE"""
+    escrow = from_template(_disputed)
+    escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
+        sender=Addr.ARBITER
     )
+    return escrow
 
-    # Verify state is terminal
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-    scenario.verify(escrow.data.dispute_state == DISPUTE_RESOLVED)
-    scenario.verify(escrow.data.dispute_outcome == DISPUTE_RESOLVED_RELEASE)
-    scenario.verify(escrow.data.dispute_resolver == TestAddresses.ARBITER)
+
+def resolved_release_escrow(scenario):
+    """Add a copy of the arbiter-released default escrow to scenario"""
+    escrow = from_template(_resolved_release)
+    scenario += escrow
+    return escrow
 
 
-@sp.add_test(name="Dispute: Arbiter can resolve with REFUND outcome")
-def test_resolve_dispute_refund():
-    """Verify arbiter can resolve dispute with refund outcome"""
+@sp.add_test(name="Fixture: create_escrow copies do not share storage")
+def test_create_escrow_copies_isolated():
+    """Verify funding one factory copy leaves the next copy in INIT"""
     scenario = sp.test_scenario()
-    scenario.h1("Dispute Lifecycle: Resolve (REFUND)")
+    scenario.h1("Fixture Isolation")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    first = create_escrow()
+    scenario += first
+    fund_escrow(scenario, first)
 
-    # Raise dispute
-    scenario += escrow.raise_dispute("Refund requested").run(
-        sender=TestAddresses.DEPOSITOR
+    second = create_escrow()
+    scenario += second
+    scenario.verify(
+        (first.data.state == STATE_FUNDED) &
+        (second.data.state == STATE_INIT)
     )
 
-    # Arbiter resolves with REFUND
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_REFUND).run(
-        sender=TestAddresses.ARBITER
-    )
 
-    # Verify state is terminal
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-    scenario.verify(escrow.data.dispute_state == DISPUTE_RESOLVED)
-    scenario.verify(escrow.data.dispute_outcome == DISPUTE_RESOLVED_REFUND)
-    scenario.verify(escrow.data.dispute_resolver == TestAddresses.ARBITER)
+# ==============================================================================
+# TEST SUITE 1: DISPUTE LIFECYCLE
+# ==============================================================================
+
+# Either party to the escrow may open a dispute
+DISPUTE_RAISERS = [
+    ("Depositor raises dispute", Addr.DEPOSITOR, "Service not delivered"),
+    ("Beneficiary raises dispute", Addr.BENEFICIARY, "Quality issues"),
+]
 
+# (arbiter outcome, resulting terminal state)
+DISPUTE_RESOLUTIONS = [
+    (DISPUTE_RESOLVED_RELEASE, STATE_RELEASED),
+    (DISPUTE_RESOLVED_REFUND, STATE_REFUNDED),
+]
 
-@sp.add_test(name="Dispute: Beneficiary can also raise dispute")
-def test_beneficiary_raise_dispute():
-    """Verify beneficiary can initiate dispute"""
+
+@sp.add_test(name="Dispute: Depositor or beneficiary can raise dispute in FUNDED state")
+def test_raise_dispute_success():
+    """Verify either party can raise a dispute"""
     scenario = sp.test_scenario()
-    scenario.h1("Dispute Authorization: Beneficiary")
+    scenario.h1("Dispute Lifecycle: Open")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    for label, sender, reason in DISPUTE_RAISERS:
+        scenario.h2(label)
+        escrow = funded_escrow(scenario)
 
-    # Beneficiary raises dispute
-    scenario += escrow.raise_dispute("Quality issues").run(
-        sender=TestAddresses.BENEFICIARY
-    )
+        scenario += escrow.raise_dispute(reason).run(sender=sender)
+
+        # Verify state
+        scenario.verify(
+            (escrow.data.dispute_state == DISPUTE_PENDING) &
+            (escrow.data.dispute_reason == reason) &
+            (escrow.data.dispute_open_at > T0) &
+            (escrow.data.dispute_deadline > escrow.data.dispute_open_at)
+        )
+
+
+@sp.add_test(name="Dispute: Arbiter can resolve with RELEASE or REFUND outcome")
+def test_resolve_dispute():
+    """Verify arbiter can resolve a dispute with either outcome"""
+    scenario = sp.test_scenario()
+    scenario.h1("Dispute Lifecycle: Resolve")
 
-    scenario.verify(escrow.data.dispute_state == DISPUTE_PENDING)
+    for outcome, terminal_state in DISPUTE_RESOLUTIONS:
+        escrow = disputed_escrow(scenario)
+        scenario += escrow.resolve_dispute(outcome).run(
+            sender=Addr.ARBITER
+        )
+
+        # Verify state is terminal
+        scenario.verify(
+            (escrow.data.state == terminal_state) &
+            (escrow.data.dispute_state == DISPUTE_RESOLVED) &
+            (escrow.data.dispute_outcome == outcome) &
+            (escrow.data.dispute_resolver == Addr.ARBITER)
+        )
 
 
 # ==============================================================================
@@ -215,18 +232,11 @@ def test_voting_blocked_during_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Dispute Isolation: Voting During Dispute")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise dispute first
-    scenario += escrow.raise_dispute("Dispute active").run(
-        sender=TestAddresses.DEPOSITOR
-    )
+    escrow = disputed_escrow(scenario)
 
     # Voting should still work even during dispute (arbiter can participate)
     scenario += escrow.vote_release().run(
-        sender=TestAddresses.DEPOSITOR,
+        sender=Addr.DEPOSITOR,
         valid=True
     )
 
@@ -237,19 +247,7 @@ def test_voting_allowed_after_resolution():
     scenario = sp.test_scenario()
     scenario.h1("Dispute Isolation: Voting After Resolution")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise and resolve dispute quickly
-    scenario += escrow.raise_dispute("Quick resolution").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    # Arbiter resolves
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
-    )
+    escrow = resolved_release_escrow(scenario)
 
     # Now escrow is RELEASED (terminal) - voting should still be blocked
     # due to state check, not dispute. This is expected behavior.
@@ -257,63 +255,55 @@ def test_voting_allowed_after_resolution():
 
 
 # ==============================================================================
-# TEST SUITE 3: AUTHORIZATION ENFORCEMENT
+# TEST SUITE 3: AUTHORIZATION AND INPUT VALIDATION
 # ==============================================================================
 
-@sp.add_test(name="Dispute: Arbiter must resolve (not depositor)")
-def test_only_arbiter_can_resolve():
-    """Verify only arbiter can call resolve_dispute()"""
-    scenario = sp.test_scenario()
-    scenario.h1("Dispute Authorization: Only Arbiter")
-
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise dispute
-    scenario += escrow.raise_dispute("Test dispute").run(
-        sender=TestAddresses.DEPOSITOR
-    )
+# (label, sender, reason) raise_dispute() calls rejected on a funded escrow
+REJECTED_RAISES = [
+    ("Arbiter cannot raise dispute", Addr.ARBITER, "Invalid"),
+    ("Unknown party cannot raise dispute", Addr.ATTACKER, "Hack attempt"),
+    ("Empty reason rejected", Addr.DEPOSITOR, ""),
+]
 
-    # Depositor tries to resolve (should fail)
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.DEPOSITOR,
-        valid=False
-    )
+# (label, sender, outcome) resolve_dispute() calls rejected while pending
+REJECTED_RESOLUTIONS = [
+    ("Depositor cannot resolve", Addr.DEPOSITOR, DISPUTE_RESOLVED_RELEASE),
+    ("Invalid outcome (2) rejected", Addr.ARBITER, sp.int(2)),
+]
 
 
-@sp.add_test(name="Dispute: Arbiter cannot raise dispute")
-def test_arbiter_cannot_raise_dispute():
-    """Verify arbiter cannot initiate disputes"""
+@sp.add_test(name="Dispute: Only a party can raise, with a reason")
+def test_raise_dispute_rejected():
+    """Verify the arbiter, unknown parties and empty reasons cannot open disputes"""
     scenario = sp.test_scenario()
-    scenario.h1("Dispute Authorization: Arbiter Cannot Raise")
+    scenario.h1("Dispute Authorization: Raise")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_escrow(scenario)
 
-    # Arbiter tries to raise dispute (should fail)
-    scenario += escrow.raise_dispute("Invalid").run(
-        sender=TestAddresses.ARBITER,
-        valid=False
-    )
+    for label, sender, reason in REJECTED_RAISES:
+        scenario.h2(label)
+        scenario += escrow.raise_dispute(reason).run(
+            sender=sender,
+            valid=False
+        )
+        scenario.verify(escrow.data.dispute_state == DISPUTE_NONE)
 
 
-@sp.add_test(name="Dispute: Unauthorized party cannot raise")
-def test_unauthorized_party_cannot_raise():
-    """Verify unknown parties cannot raise disputes"""
+@sp.add_test(name="Dispute: Only the arbiter resolves, with a valid outcome")
+def test_resolve_dispute_rejected():
+    """Verify only the arbiter can resolve, and only with outcomes 0 or 1"""
     scenario = sp.test_scenario()
-    scenario.h1("Dispute Authorization: Unknown Party Rejected")
+    scenario.h1("Dispute Authorization: Resolve")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = disputed_escrow(scenario)
 
-    # Attacker tries to raise dispute (should fail)
-    scenario += escrow.raise_dispute("Hack attempt").run(
-        sender=TestAddresses.ATTACKER,
-        valid=False
-    )
+    for label, sender, outcome in REJECTED_RESOLUTIONS:
+        scenario.h2(label)
+        scenario += escrow.resolve_dispute(outcome).run(
+            sender=sender,
+            valid=False
+        )
+        scenario.verify(escrow.data.dispute_state == DISPUTE_PENDING)
 
 
 # ==============================================================================
@@ -326,13 +316,11 @@ def test_cannot_resolve_none_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Dispute State: Prevent Resolving NONE")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_escrow(scenario)
 
     # Try to resolve when no dispute exists
     scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER,
+        sender=Addr.ARBITER,
         valid=False
     )
 
@@ -343,22 +331,11 @@ def test_cannot_double_resolve():
     scenario = sp.test_scenario()
     scenario.h1("Dispute State: Single Resolution Guarantee")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise and resolve dispute
-    scenario += escrow.raise_dispute("First resolution").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
-    )
+    escrow = resolved_release_escrow(scenario)
 
     # Try to resolve again (should fail - escrow is RELEASED)
     scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_REFUND).run(
-        sender=TestAddresses.ARBITER,
+        sender=Addr.ARBITER,
         valid=False
     )
 
@@ -369,49 +346,21 @@ def test_cannot_raise_in_released():
     scenario = sp.test_scenario()
     scenario.h1("Dispute State: FUNDED-Only Requirement")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_escrow(scenario)
 
     # Release escrow first
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-    scenario += escrow.vote_release().run(sender=TestAddresses.ARBITER)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.ARBITER)
 
     # Escrow is now RELEASED - try to raise dispute (should fail)
     scenario += escrow.raise_dispute("Too late").run(
-        sender=TestAddresses.DEPOSITOR,
+        sender=Addr.DEPOSITOR,
         valid=False
     )
 
 
 # ==============================================================================
-# TEST SUITE 5: OUTCOME VALIDATION
-# ==============================================================================
-
-@sp.add_test(name="Dispute: Invalid outcome rejected")
-def test_invalid_outcome_rejected():
-    """Verify only valid outcomes (0, 1) are accepted"""
-    scenario = sp.test_scenario()
-    scenario.h1("Dispute Outcome: Validation")
-
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise dispute
-    scenario += escrow.raise_dispute("Test").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    # Try to resolve with invalid outcome (2)
-    scenario += escrow.resolve_dispute(sp.int(2)).run(
-        sender=TestAddresses.ARBITER,
-        valid=False
-    )
-
-
-# ==============================================================================
-# TEST SUITE 6: STATE CLEARING (Dispute Lifecycle Completion)
+# TEST SUITE 5: STATE CLEARING (Dispute Lifecycle Completion)
 # ==============================================================================
 
 @sp.add_test(name="Dispute: State cleared after resolution")
@@ -420,75 +369,39 @@ def test_dispute_state_cleared_on_settlement():
     scenario = sp.test_scenario()
     scenario.h1("Dispute Lifecycle: State Cleanup on Settlement")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise dispute
-    scenario += escrow.raise_dispute("Reason note").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    # Arbiter resolves
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
-    )
+    escrow = resolved_release_escrow(scenario)
 
     # Verify dispute metadata is cleaned (timeline and reason cleared)
     scenario.verify(escrow.data.dispute_reason == "")
-    scenario.verify(escrow.data.dispute_open_at == sp.timestamp(0))
+    scenario.verify(escrow.data.dispute_open_at == T0)
     
     # But resolution info is preserved for audit trail
     scenario.verify(escrow.data.dispute_state == DISPUTE_RESOLVED)
     scenario.verify(escrow.data.dispute_outcome == DISPUTE_RESOLVED_RELEASE)
-    scenario.verify(escrow.data.dispute_resolver == TestAddresses.ARBITER)
+    scenario.verify(escrow.data.dispute_resolver == Addr.ARBITER)
 
 
 # ==============================================================================
-# TEST SUITE 7: EDGE CASES
+# TEST SUITE 6: EDGE CASES
 # ==============================================================================
 
-@sp.add_test(name="Dispute: Empty reason rejected")
-def test_empty_reason_rejected():
-    """Verify disputes require meaningful reason"""
-    scenario = sp.test_scenario()
-    scenario.h1("Dispute Reason: Empty String Validation")
-
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Try to raise dispute with empty reason
-    scenario += escrow.raise_dispute("").run(
-        sender=TestAddresses.DEPOSITOR,
-        valid=False
-    )
-
-
 @sp.add_test(name="Dispute: Cannot raise duplicate dispute")
 def test_cannot_raise_duplicate():
     """Verify only one dispute can be pending at a time"""
     scenario = sp.test_scenario()
     scenario.h1("Dispute Concurrency: Single Active Dispute")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise first dispute
-    scenario += escrow.raise_dispute("First dispute").run(
-        sender=TestAddresses.DEPOSITOR
-    )
+    escrow = disputed_escrow(scenario)
 
     # Try to raise second dispute (should fail)
     scenario += escrow.raise_dispute("Second dispute").run(
-        sender=TestAddresses.DEPOSITOR,
+        sender=Addr.DEPOSITOR,
         valid=False
     )
 
 
 # ==============================================================================
-# TEST SUITE 8: ATTACK SCENARIOS
+# TEST SUITE 7: ATTACK SCENARIOS
 # ==============================================================================
 
 @sp.add_test(name="Dispute: Prevent double-release via dispute")
@@ -497,18 +410,7 @@ def test_no_double_release():
     scenario = sp.test_scenario()
     scenario.h1("Attack Prevention: Double Release")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Raise dispute and resolve for release
-    scenario += escrow.raise_dispute("Release please").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
-    )
+    escrow = resolved_release_escrow(scenario)
 
     # Escrow is RELEASED - no further operations possible
     scenario.verify(escrow.data.state == STATE_RELEASED)
@@ -520,27 +422,25 @@ def test_voting_dispute_isolation():
     scenario = sp.test_scenario()
     scenario.h1("Attack Prevention: Voting + Dispute Collision")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_escrow(scenario)
 
     # Start voting
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
 
     # Raise dispute (blocks further voting)
     scenario += escrow.raise_dispute("Hold on voting").run(
-        sender=TestAddresses.DEPOSITOR
+        sender=Addr.DEPOSITOR
     )
 
     # Try to vote again (should fail due to dispute)
     scenario += escrow.vote_release().run(
-        sender=TestAddresses.BENEFICIARY,
+        sender=Addr.BENEFICIARY,
         valid=False
     )
 
     # Arbiter resolves dispute
     scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_REFUND).run(
-        sender=TestAddresses.ARBITER
+        sender=Addr.ARBITER
     )
 
     # Verify funds went to depositor (arbiter decision)
@@ -548,7 +448,7 @@ def test_voting_dispute_isolation():
 
 
 # ==============================================================================
-# TEST SUITE 9: TIMELINE AND DEADLINES
+# TEST SUITE 8: TIMELINE AND DEADLINES
 # ==============================================================================
 
 @sp.add_test(name="Dispute: Deadline is set on dispute open")
@@ -557,25 +457,23 @@ def test_dispute_deadline_set():
     scenario = sp.test_scenario()
     scenario.h1("Dispute Timeline: Deadline Management")
 
-    now = sp.timestamp(1000)
     escrow = create_escrow()
     scenario += escrow
 
-    fund_escrow(scenario, escrow, now=now)
+    fund_escrow(scenario, escrow, now=DISPUTE_OPENED_AT)
 
     # Raise dispute at known time
     scenario += escrow.raise_dispute("Deadline test").run(
-        sender=TestAddresses.DEPOSITOR,
-        now=now
+        sender=Addr.DEPOSITOR,
+        now=DISPUTE_OPENED_AT
     )
 
-    # Deadline should be now + DISPUTE_TIMEOUT_DEFAULT
-    expected_deadline = sp.add_seconds(now, DISPUTE_TIMEOUT_DEFAULT)
-    scenario.verify(escrow.data.dispute_deadline == expected_deadline)
+    # Deadline should be open time + DISPUTE_TIMEOUT_DEFAULT
+    scenario.verify(escrow.data.dispute_deadline == DISPUTE_DEADLINE)
 
 
 # ==============================================================================
-# TEST SUITE 10: DETERMINISTIC OUTCOME TRACKING
+# TEST SUITE 9: DETERMINISTIC OUTCOME TRACKING
 # ==============================================================================
 
 @sp.add_test(name="Dispute: Resolver address recorded for audit")
@@ -584,25 +482,15 @@ def test_resolver_recorded():
     scenario = sp.test_scenario()
     scenario.h1("Dispute Audit Trail: Resolver Recording")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    scenario += escrow.raise_dispute("Audit test").run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_RELEASE).run(
-        sender=TestAddresses.ARBITER
-    )
+    escrow = resolved_release_escrow(scenario)
 
     # Verify resolver is recorded
-    scenario.verify(escrow.data.dispute_resolver == TestAddresses.ARBITER)
+    scenario.verify(escrow.data.dispute_resolver == Addr.ARBITER)
     scenario.verify(escrow.data.dispute_outcome == DISPUTE_RESOLVED_RELEASE)
 
 
 # ==============================================================================
-# TEST SUITE 11: CONSENSUS vs DISPUTE INTERACTION
+# TEST SUITE 10: CONSENSUS vs DISPUTE INTERACTION
 # ==============================================================================
 
 @sp.add_test(name="Dispute: Cannot mix consensus voting with dispute")
@@ -611,36 +499,26 @@ def test_consensus_blocked_by_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Interaction: Consensus + Dispute Separation")
 
-    escrow = create_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_escrow(scenario)
 
     # Start voting
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
 
     # Raise dispute
     scenario += escrow.raise_dispute("Dispute blocks voting").run(
-        sender=TestAddresses.DEPOSITOR
+        sender=Addr.DEPOSITOR
     )
 
     # Beneficiary cannot vote (dispute active)
     scenario += escrow.vote_release().run(
-        sender=TestAddresses.BENEFICIARY,
+        sender=Addr.BENEFICIARY,
         valid=False
     )
 
     # But arbiter can still resolve
     scenario += escrow.resolve_dispute(DISPUTE_RESOLVED_REFUND).run(
-        sender=TestAddresses.ARBITER
+        sender=Addr.ARBITER
     )
 
     # Verify arbiter's decision takes precedence
     scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-# ==============================================================================
-# TEST COMPILATION
-# ==============================================================================
-
-if __name__ == "__main__":
-    pass
@@ -7,11 +7,23 @@ Validates core contract structure and invariants without requiring SmartPy.
 This is a quick smoke test to ensure the framework is properly structured.
 """
 
+import importlib
 import sys
-from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+
+# (module, name it must export or None) the framework must provide
+CORE_MODULES = [
+    ("contracts.core.escrow_base", None),
+    ("contracts.core.forti_escrow", None),
+    ("contracts.interfaces.types", None),
+    ("contracts.interfaces.errors", None),
+    ("contracts.interfaces.events", None),
+    ("contracts.utils.validators", None),
+    ("contracts.utils.amount_validator", None),
+    ("contracts.utils.timeline_manager", None),
+    ("contracts.invariants_enforcement", "check_invariants"),
+]
+
 
 def test_imports():
     """Test that all core modules can be imported."""
@@ -19,39 +31,21 @@ def test_imports():
     print("TEST 1: Validating Module Imports")
     print("=" * 70)
     
-    try:
-        from contracts.core import escrow_base
-        print("✅ contracts.core.escrow_base")
-        
-        from contracts.core import forti_escrow
-        print("✅ contracts.core.forti_escrow")
-        
-        from contracts.interfaces import types
-        print("✅ contracts.interfaces.types")
-        
-        from contracts.interfaces import errors
-        print("✅ contracts.interfaces.errors")
-        
-        from contracts.interfaces import events
-        print("✅ contracts.interfaces.events")
-        
-        from contracts.utils import validators
-        print("✅ contracts.utils.validators")
-        
-        from contracts.utils import amount_validator
-        print("✅ contracts.utils.amount_validator")
-        
-        from contracts.utils import timeline_manager
-        print("✅ contracts.utils.timeline_manager")
-        
-        from contracts.invariants_enforcement import check_invariants
-        print("✅ contracts.invariants_enforcement")
-        
-        print("\n✅ All modules imported successfully\n")
-        return True
-    except ImportError as e:
-        print(f"\n❌ Import Error: {e}\n")
+    failed = []
+    for name, export in CORE_MODULES:
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            failed.append(f"{name}: {e}")
+            continue
+        if export is not None and not hasattr(module, export):
+            failed.append(f"{name}: missing {export}")
+    
+    if failed:
+        print("\n❌ Import Errors:\n  " + "\n  ".join(failed) + "\n")
         return False
+    print(f"\n✅ All {len(CORE_MODULES)} modules imported successfully\n")
+    return True
 
 
 def test_contract_structure():
@@ -64,25 +58,15 @@ def test_contract_structure():
         from contracts.core.escrow_base import SimpleEscrow
         from contracts.core.forti_escrow import FortiEscrow
         
-        # Check SimpleEscrow
-        simple = SimpleEscrow.__dict__
-        required_methods = ['fund', 'release', 'refund', 'force_refund', 'get_status']
+        required_methods = {'fund', 'release', 'refund', 'force_refund', 'get_status'}
         
-        for method in required_methods:
-            if method in simple:
-                print(f"✅ SimpleEscrow.{method}")
-            else:
-                print(f"❌ SimpleEscrow.{method} - MISSING")
-                return False
-        
-        # Check FortiEscrow
-        forti = FortiEscrow.__dict__
-        for method in required_methods:
-            if method in forti:
-                print(f"✅ FortiEscrow.{method}")
-            else:
-                print(f"❌ FortiEscrow.{method} - MISSING")
+        # One set difference per class instead of a lookup per method
+        for cls in (SimpleEscrow, FortiEscrow):
+            missing = required_methods - cls.__dict__.keys()
+            if missing:
+                print(f"❌ {cls.__name__}: {', '.join(sorted(missing))} - MISSING")
                 return False
+            print(f"✅ {cls.__name__}: {', '.join(sorted(required_methods))}")
         
         print("\n✅ All required methods present\n")
         return True
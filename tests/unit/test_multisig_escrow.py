@@ -11,7 +11,8 @@ Test Categories:
     4. Timeout: Emergency recovery mechanism
     5. Attack Vectors: Adversarial scenarios
 
-Run with: python -m smartpy test tests/test_multisig_escrow.py
+Run with: python -m pytest tests/unit/test_multisig_escrow.py
+(SmartPy mock from conftest.py only; see tests/README.md)
 """
 
 import smartpy as sp
@@ -33,29 +34,22 @@ from contracts.core.escrow_base import (
     MIN_TIMEOUT_SECONDS
 )
 
+from tests._common import Addr, Amount, Timeout, from_template
+
 
 # ==============================================================================
 # TEST FIXTURES
 # ==============================================================================
 
-class TestAddresses:
-    """Standard test addresses for MultiSig"""
-    DEPOSITOR = sp.address("tz1Depositor11111111111111111111111111")
-    BENEFICIARY = sp.address("tz1Beneficiary1111111111111111111111")
-    ARBITER = sp.address("tz1Arbiter111111111111111111111111111")
-    ATTACKER = sp.address("tz1Attacker11111111111111111111111111")
-
-
-class TestAmounts:
-    """Standard test amounts"""
-    SMALL = sp.nat(1_000_000)          # 1 XTZ
-    MEDIUM = sp.nat(10_000_000)        # 10 XTZ
+# Vote tallies checked throughout the voting tests
+NO_VOTES = sp.nat(0)
+ONE_VOTE = sp.nat(1)
 
+# Funding time used by the timeout tests
+T0 = sp.timestamp(0)
 
-class TestTimeouts:
-    """Standard test timeouts"""
-    MIN = sp.nat(MIN_TIMEOUT_SECONDS)
-    WEEK = sp.nat(7 * 24 * 3600)
+# Just past the deadline of a Timeout.MIN escrow funded at T0
+AFTER_MIN_TIMEOUT = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
 
 
 def create_multisig_escrow(
@@ -65,20 +59,21 @@ def create_multisig_escrow(
     amount=None,
     timeout=None
 ):
-    """Factory for MultiSig escrow test instances"""
-    return MultiSigEscrow(
-        depositor=depositor or TestAddresses.DEPOSITOR,
-        beneficiary=beneficiary or TestAddresses.BENEFICIARY,
-        arbiter=arbiter or TestAddresses.ARBITER,
-        amount=amount or TestAmounts.SMALL,
-        timeout_seconds=timeout or TestTimeouts.WEEK
+    """Factory for MultiSig escrow test instances (fresh copy per call)"""
+    return from_template(
+        MultiSigEscrow,
+        depositor=depositor or Addr.DEPOSITOR,
+        beneficiary=beneficiary or Addr.BENEFICIARY,
+        arbiter=arbiter or Addr.ARBITER,
+        amount=amount or Amount.ESCROW,
+        timeout_seconds=timeout or Timeout.ONE_WEEK
     )
 
 
 def fund_escrow(scenario, escrow, now=None):
     """Helper to fund an escrow"""
     run_params = {
-        "sender": TestAddresses.DEPOSITOR,
+        "sender": Addr.DEPOSITOR,
         "amount": sp.utils.nat_to_mutez(escrow.data.escrow_amount)
     }
     if now is not None:
@@ -87,6 +82,23 @@ def fund_escrow(scenario, escrow, now=None):
     scenario += escrow.fund().run(**run_params)
 
 
+def _funded():
+    """Default MultiSig escrow funded by the depositor"""
+    escrow = create_multisig_escrow()
+    escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=sp.utils.nat_to_mutez(escrow.data.escrow_amount)
+    )
+    return escrow
+
+
+def funded_multisig_escrow(scenario):
+    """Add a copy of the funded default escrow to scenario"""
+    escrow = from_template(_funded)
+    scenario += escrow
+    return escrow
+
+
 # ==============================================================================
 # TEST: INITIALIZATION
 # ==============================================================================
@@ -101,14 +113,14 @@ def test_multisig_init():
     scenario += escrow
 
     # Verify parties
-    scenario.verify(escrow.data.depositor == TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.beneficiary == TestAddresses.BENEFICIARY)
-    scenario.verify(escrow.data.arbiter == TestAddresses.ARBITER)
+    scenario.verify(escrow.data.depositor == Addr.DEPOSITOR)
+    scenario.verify(escrow.data.beneficiary == Addr.BENEFICIARY)
+    scenario.verify(escrow.data.arbiter == Addr.ARBITER)
 
     # Verify state
     scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.verify(escrow.data.release_votes == sp.nat(0))
-    scenario.verify(escrow.data.refund_votes == sp.nat(0))
+    scenario.verify(escrow.data.release_votes == NO_VOTES)
+    scenario.verify(escrow.data.refund_votes == NO_VOTES)
     scenario.verify(escrow.data.dispute_state == DISPUTE_NONE)
 
 
@@ -120,14 +132,14 @@ def test_multisig_rejects_duplicates():
 
     # All parties are verified different at contract level
     scenario.verify(
-        (TestAddresses.DEPOSITOR != TestAddresses.BENEFICIARY) &
-        (TestAddresses.DEPOSITOR != TestAddresses.ARBITER) &
-        (TestAddresses.BENEFICIARY != TestAddresses.ARBITER)
+        (Addr.DEPOSITOR != Addr.BENEFICIARY) &
+        (Addr.DEPOSITOR != Addr.ARBITER) &
+        (Addr.BENEFICIARY != Addr.ARBITER)
     )
 
 
 # ==============================================================================
-# TEST: VOTING - RELEASE
+# TEST: VOTING
 # ==============================================================================
 
 @sp.add_test(name="MultiSig Vote: Single vote does not release")
@@ -136,102 +148,56 @@ def test_single_vote_no_release():
     scenario = sp.test_scenario()
     scenario.h1("Single Vote Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Depositor votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
 
     # Verify state unchanged
     scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.verify(escrow.data.release_votes == sp.nat(1))
-
-
-@sp.add_test(name="MultiSig Vote: Two votes trigger release")
-def test_two_votes_release():
-    """Verify 2-of-3 votes triggers release"""
+    scenario.verify(escrow.data.release_votes == ONE_VOTE)
+
+
+# (label, first voter, second voter, vote kind, resulting state)
+CONSENSUS_VOTES = [
+    ("Depositor + Beneficiary release",
+     Addr.DEPOSITOR, Addr.BENEFICIARY, "release", STATE_RELEASED),
+    # Bypassing the beneficiary
+    ("Depositor + Arbiter release",
+     Addr.DEPOSITOR, Addr.ARBITER, "release", STATE_RELEASED),
+    # Bypassing the depositor
+    ("Beneficiary + Arbiter release",
+     Addr.BENEFICIARY, Addr.ARBITER, "release", STATE_RELEASED),
+    ("Depositor + Arbiter refund",
+     Addr.DEPOSITOR, Addr.ARBITER, "refund", STATE_REFUNDED),
+]
+
+
+@sp.add_test(name="MultiSig Vote: Any two parties reach consensus")
+def test_two_votes_consensus():
+    """Verify every 2-of-3 voter pair executes its vote on the second vote"""
     scenario = sp.test_scenario()
-    scenario.h1("Two Vote Release Test")
-
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    scenario.h1("Two Vote Consensus Test")
 
-    # Depositor votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.release_votes == sp.nat(1))
+    # Originate every case's escrow up front, then drive the votes
+    escrows = [funded_multisig_escrow(scenario) for _ in CONSENSUS_VOTES]
 
-    # Beneficiary votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.BENEFICIARY)
+    for escrow, (label, first, second, kind, expected_state) in zip(
+        escrows, CONSENSUS_VOTES
+    ):
+        scenario.h2(label)
+        vote = "vote_" + kind
 
-    # Should auto-release
-    scenario.verify(escrow.data.state == STATE_RELEASED)
+        # First vote is counted but not executed
+        scenario += getattr(escrow, vote)().run(sender=first)
+        scenario.verify(
+            (getattr(escrow.data, kind + "_votes") == ONE_VOTE) &
+            (escrow.data.state == STATE_FUNDED)
+        )
 
-
-@sp.add_test(name="MultiSig Vote: Depositor + Arbiter can release")
-def test_depositor_arbiter_release():
-    """Verify depositor + arbiter can release (bypassing beneficiary)"""
-    scenario = sp.test_scenario()
-    scenario.h1("Depositor + Arbiter Release Test")
-
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Depositor votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-
-    # Arbiter votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.ARBITER)
-
-    # Should release
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-
-@sp.add_test(name="MultiSig Vote: Beneficiary + Arbiter can release")
-def test_beneficiary_arbiter_release():
-    """Verify beneficiary + arbiter can release (bypassing depositor)"""
-    scenario = sp.test_scenario()
-    scenario.h1("Beneficiary + Arbiter Release Test")
-
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Beneficiary votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.BENEFICIARY)
-
-    # Arbiter votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.ARBITER)
-
-    # Should release
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-
-# ==============================================================================
-# TEST: VOTING - REFUND
-# ==============================================================================
-
-@sp.add_test(name="MultiSig Vote: Two refund votes trigger refund")
-def test_two_votes_refund():
-    """Verify 2-of-3 refund votes triggers refund"""
-    scenario = sp.test_scenario()
-    scenario.h1("Two Vote Refund Test")
-
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
-
-    # Depositor votes refund
-    scenario += escrow.vote_refund().run(sender=TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.refund_votes == sp.nat(1))
-
-    # Arbiter votes refund
-    scenario += escrow.vote_refund().run(sender=TestAddresses.ARBITER)
-
-    # Should refund
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
+        # Second vote reaches the 2-of-3 threshold
+        scenario += getattr(escrow, vote)().run(sender=second)
+        scenario.verify(escrow.data.state == expected_state)
 
 
 # ==============================================================================
@@ -244,19 +210,21 @@ def test_vote_change():
     scenario = sp.test_scenario()
     scenario.h1("Vote Change Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Depositor votes release
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.release_votes == sp.nat(1))
-    scenario.verify(escrow.data.refund_votes == sp.nat(0))
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
+    scenario.verify(
+        (escrow.data.release_votes == ONE_VOTE) &
+        (escrow.data.refund_votes == NO_VOTES)
+    )
 
     # Depositor changes to refund
-    scenario += escrow.vote_refund().run(sender=TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.release_votes == sp.nat(0))
-    scenario.verify(escrow.data.refund_votes == sp.nat(1))
+    scenario += escrow.vote_refund().run(sender=Addr.DEPOSITOR)
+    scenario.verify(
+        (escrow.data.release_votes == NO_VOTES) &
+        (escrow.data.refund_votes == ONE_VOTE)
+    )
 
 
 @sp.add_test(name="MultiSig Vote: Voting same way is idempotent")
@@ -265,16 +233,14 @@ def test_vote_idempotent():
     scenario = sp.test_scenario()
     scenario.h1("Vote Idempotency Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Depositor votes release twice
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
 
     # Should still be 1 vote
-    scenario.verify(escrow.data.release_votes == sp.nat(1))
+    scenario.verify(escrow.data.release_votes == ONE_VOTE)
 
 
 # ==============================================================================
@@ -287,13 +253,11 @@ def test_nonparty_cannot_vote():
     scenario = sp.test_scenario()
     scenario.h1("Non-Party Vote Prevention Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Attacker tries to vote
     scenario += escrow.vote_release().run(
-        sender=TestAddresses.ATTACKER,
+        sender=Addr.ATTACKER,
         valid=False,
         exception=EscrowError.UNAUTHORIZED
     )
@@ -309,13 +273,11 @@ def test_depositor_raise_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Depositor Dispute Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Raise dispute
     scenario += escrow.raise_dispute("Service not delivered").run(
-        sender=TestAddresses.DEPOSITOR
+        sender=Addr.DEPOSITOR
     )
 
     scenario.verify(escrow.data.dispute_state == DISPUTE_PENDING)
@@ -328,13 +290,11 @@ def test_beneficiary_raise_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Beneficiary Dispute Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Raise dispute
     scenario += escrow.raise_dispute("Payment terms disputed").run(
-        sender=TestAddresses.BENEFICIARY
+        sender=Addr.BENEFICIARY
     )
 
     scenario.verify(escrow.data.dispute_state == DISPUTE_PENDING)
@@ -346,13 +306,11 @@ def test_arbiter_cannot_raise_dispute():
     scenario = sp.test_scenario()
     scenario.h1("Arbiter Dispute Prevention Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Arbiter tries to raise dispute
     scenario += escrow.raise_dispute("Arbiter dispute").run(
-        sender=TestAddresses.ARBITER,
+        sender=Addr.ARBITER,
         valid=False,
         exception=EscrowError.UNAUTHORIZED
     )
@@ -368,17 +326,16 @@ def test_multisig_force_refund():
     scenario = sp.test_scenario()
     scenario.h1("MultiSig Force Refund Test")
 
-    escrow = create_multisig_escrow(timeout=TestTimeouts.MIN)
+    escrow = create_multisig_escrow(timeout=Timeout.MIN)
     scenario += escrow
 
     # Fund at time 0
-    fund_escrow(scenario, escrow, now=sp.timestamp(0))
+    fund_escrow(scenario, escrow, now=T0)
 
     # Anyone can force refund after timeout
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.force_refund().run(
-        sender=TestAddresses.ATTACKER,  # Even attacker can trigger
-        now=after_timeout
+        sender=Addr.ATTACKER,  # Even attacker can trigger
+        now=AFTER_MIN_TIMEOUT
     )
 
     scenario.verify(escrow.data.state == STATE_REFUNDED)
@@ -390,14 +347,14 @@ def test_multisig_no_early_force():
     scenario = sp.test_scenario()
     scenario.h1("Early Force Refund Prevention Test")
 
-    escrow = create_multisig_escrow(timeout=TestTimeouts.WEEK)
+    escrow = create_multisig_escrow(timeout=Timeout.ONE_WEEK)
     scenario += escrow
 
-    fund_escrow(scenario, escrow, now=sp.timestamp(0))
+    fund_escrow(scenario, escrow, now=T0)
 
     # Try force refund too early
     scenario += escrow.force_refund().run(
-        sender=TestAddresses.DEPOSITOR,
+        sender=Addr.DEPOSITOR,
         now=sp.timestamp(1000),
         valid=False,
         exception=EscrowError.TIMEOUT_NOT_EXPIRED
@@ -424,8 +381,10 @@ def test_multisig_status_view():
     # Fund and check
     fund_escrow(scenario, escrow)
     status = escrow.get_status()
-    scenario.verify(status.state == STATE_FUNDED)
-    scenario.verify(status.release_votes == sp.nat(0))
+    scenario.verify(
+        (status.state == STATE_FUNDED) &
+        (status.release_votes == NO_VOTES)
+    )
 
 
 @sp.add_test(name="MultiSig View: get_votes shows voting state")
@@ -434,20 +393,22 @@ def test_multisig_votes_view():
     scenario = sp.test_scenario()
     scenario.h1("MultiSig Votes View Test")
 
-    escrow = create_multisig_escrow()
-    scenario += escrow
-    fund_escrow(scenario, escrow)
+    escrow = funded_multisig_escrow(scenario)
 
     # Initial votes
     votes = escrow.get_votes()
-    scenario.verify(votes.release_votes == sp.nat(0))
-    scenario.verify(votes.refund_votes == sp.nat(0))
+    scenario.verify(
+        (votes.release_votes == NO_VOTES) &
+        (votes.refund_votes == NO_VOTES)
+    )
 
     # After depositor votes
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
     votes = escrow.get_votes()
-    scenario.verify(votes.release_votes == sp.nat(1))
-    scenario.verify(votes.depositor_vote == VOTE_RELEASE)
+    scenario.verify(
+        (votes.release_votes == ONE_VOTE) &
+        (votes.depositor_vote == VOTE_RELEASE)
+    )
 
 
 # ==============================================================================
@@ -467,10 +428,10 @@ def test_happy_path_mutual_release():
     fund_escrow(scenario, escrow)
 
     scenario.h2("Step 2: Depositor votes release")
-    scenario += escrow.vote_release().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_release().run(sender=Addr.DEPOSITOR)
 
     scenario.h2("Step 3: Beneficiary agrees")
-    scenario += escrow.vote_release().run(sender=TestAddresses.BENEFICIARY)
+    scenario += escrow.vote_release().run(sender=Addr.BENEFICIARY)
 
     scenario.h2("Verify: Funds released")
     scenario.verify(escrow.data.state == STATE_RELEASED)
@@ -490,22 +451,14 @@ def test_happy_path_arbiter_resolution():
 
     scenario.h2("Step 2: Depositor raises dispute")
     scenario += escrow.raise_dispute("Service incomplete").run(
-        sender=TestAddresses.DEPOSITOR
+        sender=Addr.DEPOSITOR
     )
 
     scenario.h2("Step 3: Depositor wants refund")
-    scenario += escrow.vote_refund().run(sender=TestAddresses.DEPOSITOR)
+    scenario += escrow.vote_refund().run(sender=Addr.DEPOSITOR)
 
     scenario.h2("Step 4: Arbiter sides with depositor")
-    scenario += escrow.vote_refund().run(sender=TestAddresses.ARBITER)
+    scenario += escrow.vote_refund().run(sender=Addr.ARBITER)
 
     scenario.h2("Verify: Funds refunded")
     scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-# ==============================================================================
-# RUN ALL TESTS
-# ==============================================================================
-
-if __name__ == "__main__":
-    pass
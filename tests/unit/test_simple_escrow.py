@@ -11,9 +11,11 @@ Test Categories:
     4. Timeout: Deadline enforcement and recovery
     5. Edge Cases: Boundary conditions and attack vectors
 
-Run with: python -m smartpy test tests/test_simple_escrow.py
+Run with: python -m pytest tests/unit/test_simple_escrow.py
+(SmartPy mock from conftest.py only; see tests/README.md)
 """
 
+import pytest
 import smartpy as sp
 
 # Import the contract
@@ -28,48 +30,57 @@ from contracts.core.escrow_base import (
     MAX_TIMEOUT_SECONDS
 )
 
+from tests._common import Addr, Amount, Timeout, from_template
+
 
 # ==============================================================================
 # TEST FIXTURES
 # ==============================================================================
 
-class TestAddresses:
-    """Standard test addresses"""
-    DEPOSITOR = sp.address("tz1Depositor11111111111111111111111111")
-    BENEFICIARY = sp.address("tz1Beneficiary1111111111111111111111")
-    ATTACKER = sp.address("tz1Attacker11111111111111111111111111")
-    RANDOM = sp.address("tz1Random1111111111111111111111111111")
-
-
-class TestAmounts:
-    """Standard test amounts"""
-    SMALL = sp.nat(1_000_000)          # 1 XTZ
-    MEDIUM = sp.nat(10_000_000)        # 10 XTZ
-    LARGE = sp.nat(100_000_000)        # 100 XTZ
-
-
-class TestTimeouts:
-    """Standard test timeouts"""
-    MIN = sp.nat(MIN_TIMEOUT_SECONDS)          # 1 hour
-    WEEK = sp.nat(7 * 24 * 3600)               # 1 week
-    MONTH = sp.nat(30 * 24 * 3600)             # 30 days
-
-
 def create_escrow(
     depositor=None,
     beneficiary=None,
     amount=None,
     timeout=None
 ):
-    """Factory function for test escrow instances"""
-    return SimpleEscrow(
-        depositor=depositor or TestAddresses.DEPOSITOR,
-        beneficiary=beneficiary or TestAddresses.BENEFICIARY,
-        amount=amount or TestAmounts.SMALL,
-        timeout_seconds=timeout or TestTimeouts.WEEK
+    """Factory function for test escrow instances (fresh copy per call)"""
+    return from_template(
+        SimpleEscrow,
+        depositor=depositor or Addr.DEPOSITOR,
+        beneficiary=beneficiary or Addr.BENEFICIARY,
+        amount=amount or Amount.ESCROW,
+        timeout_seconds=timeout or Timeout.ONE_WEEK
     )
 
 
+# Funding time used by the funded fixtures and the timeout tests
+T0 = sp.timestamp(0)
+
+# Just past the deadline of a Timeout.MIN escrow funded at T0
+AFTER_MIN_TIMEOUT = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
+
+# Well before the deadline of a Timeout.ONE_WEEK escrow funded at T0
+BEFORE_WEEK_TIMEOUT = sp.timestamp(1000)
+
+
+def _funded(timeout):
+    """Default escrow funded by the depositor at T0"""
+    escrow = create_escrow(timeout=timeout)
+    escrow.fund().run(
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ,
+        now=T0
+    )
+    return escrow
+
+
+def funded_escrow(scenario, timeout=Timeout.ONE_WEEK):
+    """Add a copy of the default escrow, already funded at T0, to scenario"""
+    escrow = from_template(_funded, timeout)
+    scenario += escrow
+    return escrow
+
+
 # ==============================================================================
 # TEST: INITIALIZATION
 # ==============================================================================
@@ -85,41 +96,40 @@ def test_init_correct_state():
 
     # Verify initial state
     scenario.verify(escrow.data.state == STATE_INIT)
-    scenario.verify(escrow.data.depositor == TestAddresses.DEPOSITOR)
-    scenario.verify(escrow.data.beneficiary == TestAddresses.BENEFICIARY)
-    scenario.verify(escrow.data.escrow_amount == TestAmounts.SMALL)
-    scenario.verify(escrow.data.timeout_seconds == TestTimeouts.WEEK)
-
-
-@sp.add_test(name="Init: Rejects same depositor and beneficiary")
-def test_init_rejects_same_party():
-    """Verify contract rejects self-escrow (depositor == beneficiary)"""
-    scenario = sp.test_scenario()
-    scenario.h1("Self-Escrow Prevention Test")
-
-    # This should fail during initialization
-    # SmartPy handles this differently - we verify the constraint exists
-    scenario.verify(TestAddresses.DEPOSITOR != TestAddresses.BENEFICIARY)
-
-
-@sp.add_test(name="Init: Rejects zero amount")
-def test_init_rejects_zero_amount():
-    """Verify contract rejects zero escrow amount"""
-    scenario = sp.test_scenario()
-    scenario.h1("Zero Amount Prevention Test")
-
-    # Verify zero amount would be rejected
-    scenario.verify(sp.nat(0) < sp.nat(1))
-
-
-@sp.add_test(name="Init: Enforces minimum timeout")
-def test_init_enforces_min_timeout():
-    """Verify contract enforces minimum timeout (1 hour)"""
-    scenario = sp.test_scenario()
-    scenario.h1("Minimum Timeout Test")
-
-    # Verify minimum timeout constraint
-    scenario.verify(sp.nat(MIN_TIMEOUT_SECONDS) == sp.nat(3600))
+    scenario.verify(escrow.data.depositor == Addr.DEPOSITOR)
+    scenario.verify(escrow.data.beneficiary == Addr.BENEFICIARY)
+    scenario.verify(escrow.data.escrow_amount == Amount.ESCROW)
+    scenario.verify(escrow.data.timeout_seconds == Timeout.ONE_WEEK)
+
+
+# (constructor overrides, expected error) for rejected configurations;
+# the constructor is called directly because create_escrow() substitutes
+# defaults for falsy arguments such as a zero amount
+REJECTED_CONFIGS = [
+    (dict(beneficiary=Addr.DEPOSITOR), EscrowError.SAME_PARTY),
+    (dict(amount=sp.nat(0)), EscrowError.ZERO_AMOUNT),
+    (dict(timeout_seconds=sp.nat(MIN_TIMEOUT_SECONDS - 1)),
+     EscrowError.TIMEOUT_TOO_SHORT),
+    (dict(timeout_seconds=sp.nat(MAX_TIMEOUT_SECONDS + 1)),
+     EscrowError.TIMEOUT_TOO_LONG),
+]
+
+
+@sp.add_test(name="Init: Rejects invalid configurations")
+def test_init_rejects_invalid_config():
+    """Verify the constructor rejects self-escrow, zero amount and
+    out-of-range timeouts"""
+    # The constructor itself fails, so no scenario is needed
+    for overrides, error in REJECTED_CONFIGS:
+        params = dict(
+            depositor=Addr.DEPOSITOR,
+            beneficiary=Addr.BENEFICIARY,
+            amount=Amount.ESCROW,
+            timeout_seconds=Timeout.ONE_WEEK
+        )
+        params.update(overrides)
+        with pytest.raises(Exception, match=error):
+            SimpleEscrow(**params)
 
 
 # ==============================================================================
@@ -137,14 +147,14 @@ def test_fund_success():
 
     # Fund the escrow
     scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ
     )
 
     # Verify state changed
     scenario.verify(escrow.data.state == STATE_FUNDED)
-    scenario.verify(escrow.data.funded_at != sp.timestamp(0))
-    scenario.verify(escrow.data.deadline != sp.timestamp(0))
+    scenario.verify(escrow.data.funded_at != T0)
+    scenario.verify(escrow.data.deadline != T0)
 
 
 @sp.add_test(name="Fund: Non-depositor cannot fund")
@@ -158,13 +168,20 @@ def test_fund_unauthorized():
 
     # Attacker tries to fund
     scenario += escrow.fund().run(
-        sender=TestAddresses.ATTACKER,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
+        sender=Addr.ATTACKER,
+        amount=Amount.ESCROW_MUTEZ,
         valid=False,
         exception=EscrowError.NOT_DEPOSITOR
     )
 
 
+# (label, amount) pairs the depositor may not fund with
+WRONG_AMOUNTS = [
+    ("Try under-funding", Amount.HALF_MUTEZ),
+    ("Try over-funding", Amount.DOUBLE_MUTEZ),
+]
+
+
 @sp.add_test(name="Fund: Rejects incorrect amount")
 def test_fund_wrong_amount():
     """Verify contract rejects under/over-funding"""
@@ -174,21 +191,16 @@ def test_fund_wrong_amount():
     escrow = create_escrow()
     scenario += escrow
 
-    # Try under-funding
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(sp.nat(500_000)),  # Half
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
-
-    # Try over-funding
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(sp.nat(2_000_000)),  # Double
-        valid=False,
-        exception=EscrowError.AMOUNT_MISMATCH
-    )
+    # Each rejected call leaves the escrow in INIT for the next one
+    for label, amount in WRONG_AMOUNTS:
+        scenario.h2(label)
+        scenario += escrow.fund().run(
+            sender=Addr.DEPOSITOR,
+            amount=amount,
+            valid=False,
+            exception=EscrowError.AMOUNT_MISMATCH
+        )
+        scenario.verify(escrow.data.state == STATE_INIT)
 
 
 @sp.add_test(name="Fund: Cannot fund twice")
@@ -197,19 +209,13 @@ def test_fund_double_funding():
     scenario = sp.test_scenario()
     scenario.h1("Double Funding Prevention Test")
 
-    escrow = create_escrow()
-    scenario += escrow
-
-    # First funding succeeds
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
+    # First funding already succeeded
+    escrow = funded_escrow(scenario)
 
     # Second funding fails
     scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ,
         valid=False,
         exception=EscrowError.ALREADY_FUNDED
     )
@@ -219,60 +225,6 @@ def test_fund_double_funding():
 # TEST: RELEASE
 # ==============================================================================
 
-@sp.add_test(name="Release: Depositor can release to beneficiary")
-def test_release_success():
-    """Verify depositor can release funds to beneficiary"""
-    scenario = sp.test_scenario()
-    scenario.h1("Release Success Test")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund first
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-
-    # Release
-    scenario += escrow.release().run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    # Verify state
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-
-@sp.add_test(name="Release: Non-depositor cannot release")
-def test_release_unauthorized():
-    """Verify non-depositor cannot release funds"""
-    scenario = sp.test_scenario()
-    scenario.h1("Unauthorized Release Test")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-
-    # Attacker tries to release
-    scenario += escrow.release().run(
-        sender=TestAddresses.ATTACKER,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-    # Beneficiary tries to release
-    scenario += escrow.release().run(
-        sender=TestAddresses.BENEFICIARY,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
-
-
 @sp.add_test(name="Release: Cannot release from INIT state")
 def test_release_not_funded():
     """Verify cannot release before funding"""
@@ -284,7 +236,7 @@ def test_release_not_funded():
 
     # Try to release without funding
     scenario += escrow.release().run(
-        sender=TestAddresses.DEPOSITOR,
+        sender=Addr.DEPOSITOR,
         valid=False,
         exception=EscrowError.NOT_FUNDED
     )
@@ -296,76 +248,47 @@ def test_release_after_deadline():
     scenario = sp.test_scenario()
     scenario.h1("Release After Deadline Test")
 
-    # Create escrow with minimum timeout
-    escrow = create_escrow(timeout=TestTimeouts.MIN)
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
-        now=sp.timestamp(0)
-    )
+    # Funded escrow with minimum timeout
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN)
 
     # Try to release after deadline
-    after_deadline = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.release().run(
-        sender=TestAddresses.DEPOSITOR,
-        now=after_deadline,
+        sender=Addr.DEPOSITOR,
+        now=AFTER_MIN_TIMEOUT,
         valid=False,
         exception=EscrowError.DEADLINE_PASSED
     )
 
 
 # ==============================================================================
-# TEST: REFUND
+# TEST: RELEASE / REFUND AUTHORIZATION
 # ==============================================================================
 
-@sp.add_test(name="Refund: Depositor can refund")
-def test_refund_success():
-    """Verify depositor can refund their funds"""
-    scenario = sp.test_scenario()
-    scenario.h1("Refund Success Test")
+# (label, sender, entrypoint) against a funded escrow; all are depositor-only
+UNAUTHORIZED_CLOSES = [
+    ("Attacker tries to release", Addr.ATTACKER, "release"),
+    ("Beneficiary tries to release", Addr.BENEFICIARY, "release"),
+    ("Attacker tries to refund", Addr.ATTACKER, "refund"),
+]
 
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-
-    # Refund
-    scenario += escrow.refund().run(
-        sender=TestAddresses.DEPOSITOR
-    )
-
-    # Verify state
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
 
-
-@sp.add_test(name="Refund: Non-depositor cannot refund")
-def test_refund_unauthorized():
-    """Verify non-depositor cannot refund"""
+@sp.add_test(name="Auth: Non-depositor cannot release or refund")
+def test_close_unauthorized():
+    """Verify non-depositors cannot release or refund funds"""
     scenario = sp.test_scenario()
-    scenario.h1("Unauthorized Refund Test")
+    scenario.h1("Unauthorized Release/Refund Test")
 
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
+    escrow = funded_escrow(scenario)
 
-    # Attacker tries to refund
-    scenario += escrow.refund().run(
-        sender=TestAddresses.ATTACKER,
-        valid=False,
-        exception=EscrowError.NOT_DEPOSITOR
-    )
+    # Each rejected call leaves the escrow funded for the next one
+    for label, sender, entrypoint in UNAUTHORIZED_CLOSES:
+        scenario.h2(label)
+        scenario += getattr(escrow, entrypoint)().run(
+            sender=sender,
+            valid=False,
+            exception=EscrowError.NOT_DEPOSITOR
+        )
+        scenario.verify(escrow.data.state == STATE_FUNDED)
 
 
 # ==============================================================================
@@ -378,21 +301,12 @@ def test_force_refund_after_timeout():
     scenario = sp.test_scenario()
     scenario.h1("Force Refund After Timeout Test")
 
-    escrow = create_escrow(timeout=TestTimeouts.MIN)
-    scenario += escrow
-
-    # Fund at time 0
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario, timeout=Timeout.MIN)
 
     # Random address triggers force refund after timeout
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
     scenario += escrow.force_refund().run(
-        sender=TestAddresses.RANDOM,
-        now=after_timeout
+        sender=Addr.RANDOM_THIRD_PARTY,
+        now=AFTER_MIN_TIMEOUT
     )
 
     # Verify state
@@ -405,21 +319,12 @@ def test_force_refund_before_timeout():
     scenario = sp.test_scenario()
     scenario.h1("Force Refund Before Timeout Test")
 
-    escrow = create_escrow(timeout=TestTimeouts.WEEK)
-    scenario += escrow
-
-    # Fund
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
-        now=sp.timestamp(0)
-    )
+    escrow = funded_escrow(scenario)
 
     # Try force refund before timeout
-    before_timeout = sp.timestamp(1000)  # Only 1000 seconds
     scenario += escrow.force_refund().run(
-        sender=TestAddresses.RANDOM,
-        now=before_timeout,
+        sender=Addr.RANDOM_THIRD_PARTY,
+        now=BEFORE_WEEK_TIMEOUT,
         valid=False,
         exception=EscrowError.TIMEOUT_NOT_EXPIRED
     )
@@ -429,44 +334,42 @@ def test_force_refund_before_timeout():
 # TEST: STATE MACHINE INVARIANTS
 # ==============================================================================
 
+# (label, closing entrypoint, terminal state, rejected follow-up call,
+#  follow-up amount, expected error) for each terminal state
+TERMINAL_TRANSITIONS = [
+    ("RELEASED rejects fund", "release", STATE_RELEASED,
+     "fund", Amount.ESCROW_MUTEZ, EscrowError.ALREADY_FUNDED),
+    ("REFUNDED rejects release", "refund", STATE_REFUNDED,
+     "release", sp.tez(0), EscrowError.NOT_FUNDED),
+]
+
+
 @sp.add_test(name="State: Cannot transition from terminal states")
 def test_no_transition_from_terminal():
     """Verify no transitions allowed from RELEASED or REFUNDED"""
     scenario = sp.test_scenario()
     scenario.h1("Terminal State Test")
 
-    # Test RELEASED terminal state
-    escrow1 = create_escrow()
-    scenario += escrow1
-
-    scenario += escrow1.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-    scenario += escrow1.release().run(sender=TestAddresses.DEPOSITOR)
-
-    # Try to fund again
-    scenario += escrow1.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
-        valid=False
-    )
-
-    # Test REFUNDED terminal state
-    escrow2 = create_escrow()
-    scenario += escrow2
-
-    scenario += escrow2.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-    scenario += escrow2.refund().run(sender=TestAddresses.DEPOSITOR)
-
-    # Try to release
-    scenario += escrow2.release().run(
-        sender=TestAddresses.DEPOSITOR,
-        valid=False
-    )
+    for (label, close, terminal_state,
+         follow_up, amount, error) in TERMINAL_TRANSITIONS:
+        scenario.h2(label)
+        escrow = funded_escrow(scenario)
+        scenario += getattr(escrow, close)().run(
+            sender=Addr.DEPOSITOR
+        )
+        scenario.verify(
+            (escrow.data.state == terminal_state) &
+            escrow.get_status().is_terminal
+        )
+
+        # Any further transition is rejected
+        scenario += getattr(escrow, follow_up)().run(
+            sender=Addr.DEPOSITOR,
+            amount=amount,
+            valid=False,
+            exception=error
+        )
+        scenario.verify(escrow.data.state == terminal_state)
 
 
 # ==============================================================================
@@ -484,110 +387,58 @@ def test_view_get_status():
 
     # Check initial status
     initial_status = escrow.get_status()
-    scenario.verify(initial_status.state == STATE_INIT)
-    scenario.verify(initial_status.is_funded == False)
-    scenario.verify(initial_status.is_terminal == False)
+    scenario.verify(
+        (initial_status.state == STATE_INIT) &
+        (initial_status.is_funded == False) &
+        (initial_status.is_terminal == False)
+    )
 
     # Fund and check again
     scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
+        sender=Addr.DEPOSITOR,
+        amount=Amount.ESCROW_MUTEZ
     )
 
     funded_status = escrow.get_status()
-    scenario.verify(funded_status.state == STATE_FUNDED)
-    scenario.verify(funded_status.is_funded == True)
-    scenario.verify(funded_status.can_release == True)
-    scenario.verify(funded_status.can_refund == True)
+    scenario.verify(
+        (funded_status.state == STATE_FUNDED) &
+        (funded_status.is_funded == True) &
+        (funded_status.can_release == True) &
+        (funded_status.can_refund == True) &
+        (funded_status.is_terminal == False)
+    )
 
 
 # ==============================================================================
 # TEST: HAPPY PATHS
 # ==============================================================================
 
-@sp.add_test(name="Happy Path: Complete release flow")
-def test_happy_path_release():
-    """Verify complete fund -> release flow"""
+# (label, timeout, closing entrypoint, sender, time of close, terminal state)
+# for every path out of FUNDED
+HAPPY_PATHS = [
+    ("Depositor releases to beneficiary", Timeout.ONE_WEEK,
+     "release", Addr.DEPOSITOR, BEFORE_WEEK_TIMEOUT, STATE_RELEASED),
+    ("Depositor refunds", Timeout.ONE_WEEK,
+     "refund", Addr.DEPOSITOR, BEFORE_WEEK_TIMEOUT, STATE_REFUNDED),
+    ("Third party triggers recovery after timeout", Timeout.MIN,
+     "force_refund", Addr.RANDOM_THIRD_PARTY, AFTER_MIN_TIMEOUT,
+     STATE_REFUNDED),
+]
+
+
+@sp.add_test(name="Happy Path: Release, refund and timeout recovery flows")
+def test_happy_paths():
+    """Verify fund -> release, fund -> refund and fund -> force_refund flows"""
     scenario = sp.test_scenario()
-    scenario.h1("Happy Path: Release")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Step 1: Fund
-    scenario.h2("Step 1: Depositor funds escrow")
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-    scenario.verify(escrow.data.state == STATE_FUNDED)
-
-    # Step 2: Release
-    scenario.h2("Step 2: Depositor releases to beneficiary")
-    scenario += escrow.release().run(
-        sender=TestAddresses.DEPOSITOR
-    )
-    scenario.verify(escrow.data.state == STATE_RELEASED)
-
-
-@sp.add_test(name="Happy Path: Complete refund flow")
-def test_happy_path_refund():
-    """Verify complete fund -> refund flow"""
-    scenario = sp.test_scenario()
-    scenario.h1("Happy Path: Refund")
-
-    escrow = create_escrow()
-    scenario += escrow
-
-    # Step 1: Fund
-    scenario.h2("Step 1: Depositor funds escrow")
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL)
-    )
-
-    # Step 2: Refund
-    scenario.h2("Step 2: Depositor refunds")
-    scenario += escrow.refund().run(
-        sender=TestAddresses.DEPOSITOR
-    )
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-@sp.add_test(name="Happy Path: Timeout recovery flow")
-def test_happy_path_timeout_recovery():
-    """Verify fund -> timeout -> force_refund flow"""
-    scenario = sp.test_scenario()
-    scenario.h1("Happy Path: Timeout Recovery")
-
-    escrow = create_escrow(timeout=TestTimeouts.MIN)
-    scenario += escrow
-
-    # Step 1: Fund
-    scenario.h2("Step 1: Depositor funds escrow")
-    scenario += escrow.fund().run(
-        sender=TestAddresses.DEPOSITOR,
-        amount=sp.utils.nat_to_mutez(TestAmounts.SMALL),
-        now=sp.timestamp(0)
-    )
-
-    # Step 2: Wait for timeout
-    scenario.h2("Step 2: Timeout expires")
-    after_timeout = sp.timestamp(MIN_TIMEOUT_SECONDS + 1)
-
-    # Step 3: Anyone triggers recovery
-    scenario.h2("Step 3: Third party triggers recovery")
-    scenario += escrow.force_refund().run(
-        sender=TestAddresses.RANDOM,
-        now=after_timeout
-    )
-    scenario.verify(escrow.data.state == STATE_REFUNDED)
-
-
-# ==============================================================================
-# RUN ALL TESTS
-# ==============================================================================
-
-if __name__ == "__main__":
-    # Tests are automatically discovered and run by SmartPy
-    pass
+    scenario.h1("Happy Path: Release, Refund and Timeout Recovery")
+
+    for label, timeout, entrypoint, sender, now, terminal_state in HAPPY_PATHS:
+        # Step 1: Depositor funded the escrow at T0
+        scenario.h2("Step 1: Depositor funds escrow")
+        escrow = funded_escrow(scenario, timeout=timeout)
+        scenario.verify(escrow.data.state == STATE_FUNDED)
+
+        # Step 2: Close
+        scenario.h2("Step 2: " + label)
+        scenario += getattr(escrow, entrypoint)().run(sender=sender, now=now)
+        scenario.verify(escrow.data.state == terminal_state)